@@ -3,23 +3,38 @@ import csv
 import json
 import asyncio
 import aiohttp
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Any, Optional, Callable
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
 import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 import argparse
 from datetime import datetime
 import re
+import sys
 import logging
 import random
-import statistics
+import hashlib
+import heapq
+import gzip
+import pickle
+import weakref
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
-# Configure logging
+try:
+    import orjson  # Faster JSON for backend payloads; falls back to the stdlib
+except ImportError:
+    orjson = None
+
+# Configure logging; --debug raises the level to DEBUG for request/SSE JSON dumps
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('evaluation_debug.log'),
@@ -28,14 +43,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sentinel for single-lookup dict.get() where None is a meaningful value
+_MISSING = object()
+
+# Per-request rubric debug output (radio JSON, filtered items); enable with DEBUG_RADIO=1
+DEBUG_RADIO = os.environ.get("DEBUG_RADIO") == "1"
+
 # QWERTY order for radio button option letters
 QWERTY_LETTERS = "QWERTYUIOPASDFGHJKLZXCVBNM"
 
+# Gradescope CSV layout: leading metadata columns and non-graded header columns
+METADATA_COLUMN_COUNT = 8
+EXCLUDED_HEADERS = frozenset(("Adjustment", "Comments", "Grader", "Tags"))
+RADIO_HEADER_RE = re.compile(r'\[RADIO (\d+)\](.+)')  # "[RADIO <group>] <description>" columns
+# Text of a checked cell once stripped and upper-cased (Gradescope's casing varies)
+TRUE_TEXT = "TRUE"
+# Backend CHECKBOX decision meaning "checked"; interned so decisions interned at ingest compare by identity
+CHECK_DECISION = sys.intern("check")
+
+# Report text for a checkbox value, indexed by bool
+BOOL_TEXT = ("FALSE", "TRUE")
+
+# Shared report styles, built once and reused for every cell
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_FONT = Font(color="FFFFFF", bold=True)
+MATCH_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Green
+FALSE_POSITIVE_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
+FALSE_NEGATIVE_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Yellow
+NEUTRAL_FILL = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")  # Light blue
+POINTS_HEADER_FILL = PatternFill(start_color="0F243E", end_color="0F243E", fill_type="solid")
+TOTALS_FILL = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")  # Pale green
+BOLD_FONT = Font(bold=True)
+NORMAL_FONT = Font(bold=False)
+TITLE_FONT = Font(size=16, bold=True)
+SECTION_FONT = Font(bold=True, size=12)
+SUBSECTION_FONT = Font(bold=True, size=11)
+OVERVIEW_FONT = Font(bold=True, size=14)
+POINTS_TITLE_FONT = Font(bold=True, size=16, color="0F243E")
+LARGE_DIFF_FONT = Font(color="C00000")  # Red
+MEDIUM_DIFF_FONT = Font(color="FF8C00")  # Orange
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+WRAP_ALIGNMENT = Alignment(wrap_text=True)
+CENTER_WRAP_ALIGNMENT = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+# Accuracy bands (minimum %, label, fill) for color-coded accuracy cells; anything lower is POOR_ACCURACY_BAND
+ACCURACY_BANDS = ((90, "Excellent", MATCH_FILL), (80, "Good", NEUTRAL_FILL), (70, "Fair", FALSE_NEGATIVE_FILL))
+POOR_ACCURACY_BAND = ("Poor", FALSE_POSITIVE_FILL)
+STUDENT_RESULT_FILLS = (MATCH_FILL, FALSE_POSITIVE_FILL, FALSE_NEGATIVE_FILL)
+# (match text, fill) for a checkbox cell, indexed by [human checked][backend checked]
+CHECKBOX_OUTCOMES = (
+    (("MATCH", MATCH_FILL), ("FALSE POSITIVE", FALSE_POSITIVE_FILL)),
+    (("FALSE NEGATIVE", FALSE_NEGATIVE_FILL), ("MATCH", MATCH_FILL)),
+)
+# (label, fill) for a points difference, indexed by points_difference_codes()
+POINTS_DIFFERENCE_STATUSES = (("EXACT MATCH", NEUTRAL_FILL), ("AI HIGHER", MATCH_FILL), ("AI LOWER", FALSE_POSITIVE_FILL))
+
+# Column letters A..ZZ, computed once for column width loops
+COLUMN_LETTERS = [get_column_letter(col) for col in range(1, 703)]
+
+# Parsed grades CSVs are pickled here (under the output directory) keyed by path and mtime
+RUBRIC_CACHE_DIRNAME = ".rubric_cache"
+RUBRIC_CACHE_VERSION = 1  # Bump when CSVParser output changes shape
+RESULT_CACHE_DIRNAME = ".result_cache"
+
+# Output formats for the unified per-project report
+REPORT_FORMATS = ("xlsx", "csv")
+
 # Concurrent batch processing configuration
 DEFAULT_CONCURRENT_BATCH_SIZE = 10  # Number of students to process concurrently
+DEFAULT_PROJECT_CONCURRENCY = 2  # Number of projects evaluated at once in sequential mode
+DEFAULT_REPORT_WORKERS = 1  # Processes computing cross-project report stats; 1 computes in-process
+BACKEND_CONNECTION_LIMIT = 64  # Pooled connections shared by all concurrent requests
+BACKEND_KEEPALIVE_TIMEOUT = 60  # Seconds an idle pooled connection stays open
+BACKEND_DNS_CACHE_TTL = 300  # Seconds a resolved backend address is reused
+GZIP_MIN_REQUEST_BYTES = 64 * 1024  # Smaller request bodies are sent uncompressed
+GZIP_COMPRESSION_LEVEL = 6
 
 
-@dataclass
+@dataclass(slots=True)
 class RubricItem:
     """Represents a single rubric item."""
     id: str
@@ -59,7 +149,7 @@ class EvaluationTask:
     rubric_items_list: List[Any]  # List of RubricItem objects
 
 
-@dataclass 
+@dataclass(slots=True)
 class StudentGrade:
     """Represents a student's grades."""
     submission_id: str
@@ -72,9 +162,34 @@ class AIGradingResult:
     """Represents AI grading results for a student."""
     submission_id: str
     decisions: Dict[str, Any]  # Maps rubric_item_id -> GradingDecision
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionValue:
+    """Stand-in for the backend's RubricDecision enum; `value` is "CHECK" or "CROSS"."""
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class Verdict:
+    """A checkbox decision or a radio selection, as PointsCalculator reads it."""
+    decision: Optional[DecisionValue] = None
+    selected_option: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class GradingDecision:
+    """A backend result in the decision -> verdict shape of the grading API."""
+    verdict: Verdict
+
+
+# Checkbox outcomes are shared instances; only radio selections need a new object
+CHECKED_DECISION = GradingDecision(Verdict(decision=DecisionValue("CHECK")))
+CROSSED_DECISION = GradingDecision(Verdict(decision=DecisionValue("CROSS")))
+EMPTY_DECISION = GradingDecision(Verdict())
     
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Represents the result of evaluating a single rubric item."""
     submission_id: str
@@ -93,6 +208,7 @@ class PointsComparison:
     ai_total: float  
     difference: float
     rubric_breakdown: Dict[str, Dict[str, float]]  # rubric_id -> {"human": points, "ai": points}
+    csv_name: str = "Unknown"  # Set when comparisons from several CSVs are combined
 
 
 @dataclass
@@ -108,6 +224,7 @@ class RubricItemStats:
     ai_std: float
     agreement_rate: float  # For categorical items, % agreement
     sample_size: int
+    csv_name: str = "Unknown"  # Set when stats from several CSVs are combined
 
 
 def add_credit_indicators_to_radio_options(options: Dict[str, Dict[str, str]]) -> Dict[str, str]:
@@ -115,6 +232,28 @@ def add_credit_indicators_to_radio_options(options: Dict[str, Dict[str, str]]) -
     if not options:
         return {}
     
+    # Identical option sets recur for every student and CSV, so memoize on a frozen copy
+    options_key = tuple(
+        (letter, True, tuple(option_data.items())) if isinstance(option_data, dict) else (letter, False, option_data)
+        for letter, option_data in options.items()
+    )
+    try:
+        return dict(_cached_credit_indicators(options_key))
+    except TypeError:  # Unhashable option values
+        return _credit_indicators(options)
+
+
+@lru_cache(maxsize=1024)
+def _cached_credit_indicators(options_key: Tuple[Tuple[str, bool, Any], ...]) -> Dict[str, str]:
+    """Memoized _credit_indicators keyed by a frozen options tuple."""
+    return _credit_indicators({
+        letter: dict(option_data) if is_dict else option_data
+        for letter, is_dict, option_data in options_key
+    })
+
+
+def _credit_indicators(options: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+    """Map each option letter to its text plus a full/partial/no credit indicator."""
     # Find the maximum point value
     max_points = 0.0
     for option_data in options.values():
@@ -153,6 +292,9 @@ def add_credit_indicators_to_radio_options(options: Dict[str, Dict[str, str]]) -
 
 def print_radio_button_json(backend_rubric_items, context=""):
     """Print radio button JSON being sent to backend for debugging."""
+    if not DEBUG_RADIO:
+        return
+    
     radio_items = [item for item in backend_rubric_items if item.get("type") == "RADIO"]
     
     if radio_items:
@@ -180,13 +322,15 @@ def filter_rubric_items_for_backend(rubric_items: List[RubricItem]) -> List[Rubr
     for rubric_item in rubric_items:
         # Filter out bonus point questions (case-insensitive)
         if rubric_item.description and '(bonus point)' in rubric_item.description.lower():
-            print(f"🚫 Filtering out bonus point question: {rubric_item.id} - \"{rubric_item.description[:60]}...\"")
+            if DEBUG_RADIO:
+                print(f"🚫 Filtering out bonus point question: {rubric_item.id} - \"{rubric_item.description[:60]}...\"")
             filtered_count += 1
             continue
             
         # Also filter out zero-point items that are often just for human graders
         if rubric_item.type == 'CHECKBOX' and rubric_item.points == 0:
-            print(f"🚫 Filtering out zero-point checkbox: {rubric_item.id} - \"{rubric_item.description[:60]}...\"")
+            if DEBUG_RADIO:
+                print(f"🚫 Filtering out zero-point checkbox: {rubric_item.id} - \"{rubric_item.description[:60]}...\"")
             filtered_count += 1 
             continue
             
@@ -198,65 +342,271 @@ def filter_rubric_items_for_backend(rubric_items: List[RubricItem]) -> List[Rubr
     return filtered_items
 
 
+def build_backend_rubric_items(rubric_items: List[RubricItem]) -> List[Dict[str, Any]]:
+    """Convert filtered rubric items to the request format; shared read-only by every student of a CSV."""
+    backend_rubric_items = []
+    for rubric_item in rubric_items:
+        item_dict = {
+            "id": rubric_item.id,
+            "description": rubric_item.description,
+            "points": rubric_item.points,
+            "type": rubric_item.type
+        }
+        if rubric_item.options:
+            # Convert letter-based options to backend format
+            if rubric_item.type == "RADIO":
+                # Options are in format: {"Q": {"text": "...", "points": "..."}, "W": {...}}
+                # Backend expects: {"Q": "option text with credit indicator", "W": "option text with credit indicator"}
+                item_dict["options"] = add_credit_indicators_to_radio_options(rubric_item.options)
+            else:
+                item_dict["options"] = rubric_item.options
+        backend_rubric_items.append(item_dict)
+    return backend_rubric_items
+
+
+def index_backend_results(
+    backend_results: Dict[str, List[EvaluationResult]]
+) -> Dict[str, Dict[str, EvaluationResult]]:
+    """Map submission_id -> rubric_id -> first backend result for that rubric item."""
+    backend_index = {}
+    for submission_id, results in backend_results.items():
+        by_rubric = {}
+        for result in results:
+            by_rubric.setdefault(result.rubric_id, result)
+        backend_index[submission_id] = by_rubric
+    return backend_index
+
+
+def rubric_types_by_id(rubric_items: List[RubricItem]) -> Dict[str, str]:
+    """Map rubric item id -> "CHECKBOX" / "RADIO"."""
+    return {rubric_item.id: rubric_item.type for rubric_item in rubric_items}
+
+
+def ai_grading_result(
+    submission_id: str,
+    results: List[EvaluationResult],
+    rubric_types: Dict[str, str]
+) -> AIGradingResult:
+    """Wrap a submission's backend results as an AIGradingResult for PointsCalculator.
+    
+    `rubric_types` (from rubric_types_by_id) decides checkbox vs radio; results for
+    unknown rubric items get an empty verdict.
+    """
+    decisions = {}
+    get_type = rubric_types.get
+    for result in results:
+        rubric_type = get_type(result.rubric_id)
+        if rubric_type == "CHECKBOX":
+            decision = CHECKED_DECISION if result.decision == CHECK_DECISION else CROSSED_DECISION
+        elif rubric_type == "RADIO":
+            decision = GradingDecision(Verdict(selected_option=result.decision))
+        else:
+            decision = EMPTY_DECISION
+        decisions[result.rubric_id] = decision
+    return AIGradingResult(submission_id=submission_id, decisions=decisions)
+
+
+def human_grade_rows(rubric_items: List[RubricItem], human_grades: Dict[str, StudentGrade]) -> List[List[Any]]:
+    """Each student's grade per rubric item (False where ungraded), in human_grades order."""
+    rubric_ids = [rubric_item.id for rubric_item in rubric_items]
+    rows = []
+    for student_grade in human_grades.values():
+        get_grade = student_grade.grades.get
+        rows.append([get_grade(rubric_id, False) for rubric_id in rubric_ids])
+    return rows
+
+
+def compute_rubric_summary_stats(
+    rubric_items: List[RubricItem],
+    human_grades: Dict[str, StudentGrade],
+    backend_results: Dict[str, List[EvaluationResult]],
+    backend_index: Optional[Dict[str, Dict[str, EvaluationResult]]] = None,
+    human_rows: Optional[List[List[Any]]] = None,
+    result_rows: Optional[List[List[Optional[EvaluationResult]]]] = None
+) -> List[Dict[str, Any]]:
+    """Compute per-rubric match/mismatch counts over a (student x rubric) grid.
+    
+    Pass `backend_index` (from index_backend_results) and `human_rows` (from
+    human_grade_rows) when the caller already built them. `result_rows` holds each
+    student's first backend result per rubric item (None where missing), aligned
+    with `human_rows`; a caller that already looked every result up passes it so
+    the backend results are not walked again.
+    """
+    if backend_index is None and result_rows is None:
+        backend_index = index_backend_results(backend_results)
+    if human_rows is None:
+        human_rows = human_grade_rows(rubric_items, human_grades)
+    shape = (len(human_grades), len(rubric_items))
+    rubric_ids = [rubric_item.id for rubric_item in rubric_items]
+    column_of = {rubric_id: col for col, rubric_id in enumerate(rubric_ids)}
+
+    # Stage grades and decisions as numeric grids: strings become small integer codes so
+    # every comparison below runs on contiguous int/bool arrays instead of Python objects
+    codes: Dict[str, int] = {}
+    code_of = codes.setdefault
+    human_bool = np.array(
+        [[bool(value) for value in row] for row in human_rows], dtype=bool
+    ).reshape(shape)
+    human_code = np.array(
+        [[code_of(str(value), len(codes)) for value in row] for row in human_rows], dtype=np.int32
+    ).reshape(shape)
+    decision_code = np.full(shape, -1, dtype=np.int32)  # -1: no backend result
+    confidence_arr = np.zeros(shape)
+    has_result = np.zeros(shape, dtype=bool)
+
+    if result_rows is not None:
+        for row, results in enumerate(result_rows):
+            for col, result in enumerate(results):
+                if result is not None:
+                    has_result[row, col] = True
+                    decision_code[row, col] = code_of(result.decision, len(codes))
+                    confidence_arr[row, col] = result.confidence
+    else:
+        for row, submission_id in enumerate(human_grades):
+            # The index already keeps only the first result per rubric item
+            for rubric_id, result in backend_index.get(submission_id, {}).items():
+                col = column_of.get(rubric_id)
+                if col is not None:
+                    has_result[row, col] = True
+                    decision_code[row, col] = code_of(result.decision, len(codes))
+                    confidence_arr[row, col] = result.confidence
+
+    # CHECKBOX: compare booleans; RADIO: compare letters, all mismatches count as false positives
+    is_checkbox = np.array([rubric_item.type == "CHECKBOX" for rubric_item in rubric_items], dtype=bool)
+    backend_bool = decision_code == codes.get(CHECK_DECISION, -2)
+    radio_match = human_code == decision_code
+
+    # Each outcome is an independent boolean kernel over the grid
+    match_arr = has_result & np.where(is_checkbox, human_bool == backend_bool, radio_match)
+    false_negative_arr = has_result & is_checkbox & human_bool & ~backend_bool
+    false_positive_arr = has_result & np.where(is_checkbox, ~human_bool & backend_bool, ~radio_match)
+
+    total = shape[0]
+    matches = match_arr.sum(axis=0)
+    false_positives = false_positive_arr.sum(axis=0)
+    false_negatives = false_negative_arr.sum(axis=0)
+    confidence_count = has_result.sum(axis=0)
+    confidence_sum = confidence_arr.sum(axis=0)
+    # Rates over students with a backend result; 0 where a rubric has none
+    has_count = confidence_count > 0
+    accuracy = np.divide(matches, confidence_count, out=np.zeros(len(rubric_items)), where=has_count)
+    avg_confidence = np.divide(confidence_sum, confidence_count, out=np.zeros(len(rubric_items)), where=has_count)
+
+    stats = []
+    for col, rubric_item in enumerate(rubric_items):
+        count = int(confidence_count[col])  # students with a backend result
+        stats.append({
+            'rubric': rubric_item.description,
+            'type': rubric_item.type,
+            'total': total,
+            'matches': int(matches[col]),
+            'false_positives': int(false_positives[col]),
+            'false_negatives': int(false_negatives[col]),
+            'no_data': total - count,
+            'accuracy': float(accuracy[col]),
+            'avg_confidence': float(avg_confidence[col]),
+            'confidence_sum': float(confidence_sum[col])
+        })
+
+    return stats
+
+
+def shorten(text: str, limit: int, keep: Optional[int] = None) -> str:
+    """Cut text longer than `limit` to its first `keep` (default `limit`) characters plus '...'."""
+    if len(text) <= limit:
+        return text
+    return text[:limit if keep is None else keep] + "..."
+
+
+def average(values: List[float]) -> float:
+    """Arithmetic mean of a non-empty list."""
+    return sum(values) / len(values)
+
+
+def comparison_arrays(comparisons: List[PointsComparison]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Human totals, AI totals and differences of the comparisons as float arrays."""
+    columns = np.array(
+        [(c.human_total, c.ai_total, c.difference) for c in comparisons], dtype=np.float64
+    ).reshape(-1, 3)
+    return columns[:, 0], columns[:, 1], columns[:, 2]
+
+
+def points_difference_codes(differences: np.ndarray) -> np.ndarray:
+    """0 where AI and human points agree (within 0.01), 1 where AI is higher, 2 where lower."""
+    return np.where(np.abs(differences) < 0.01, 0, np.where(differences > 0, 1, 2))
+
+
+def sample_std(values: np.ndarray) -> float:
+    """Sample standard deviation of an array; 0.0 below two values."""
+    return float(values.std(ddof=1)) if values.size > 1 else 0.0
+
+
 class PointsCalculator:
     """Calculates and compares points between AI and human graders."""
     
     @staticmethod
-    def calculate_human_points(student_grade: StudentGrade, rubric_items: List[RubricItem]) -> Dict[str, float]:
-        """Calculate points earned by human grader for each rubric item."""
-        points_breakdown = {}
+    def build_scorers(rubric_items: List[RubricItem]) -> List[Tuple[str, bool, Callable[[Any], float]]]:
+        """Precompute (rubric_id, is_checkbox, grade -> points) once per rubric item."""
+        scorers = []
         
         for rubric_item in rubric_items:
-            if rubric_item.id not in student_grade.grades:
-                points_breakdown[rubric_item.id] = 0.0
-                continue
-                
             if rubric_item.type == "CHECKBOX":
                 # Checkbox: full points if checked, 0 if not
-                is_checked = student_grade.grades[rubric_item.id]
-                points_breakdown[rubric_item.id] = rubric_item.points if is_checked else 0.0
-                
+                def score(is_checked, points=rubric_item.points):
+                    return points if is_checked else 0.0
             elif rubric_item.type == "RADIO":
                 # Radio: points based on selected option
-                selected_option = student_grade.grades[rubric_item.id]
-                if selected_option and rubric_item.options and selected_option in rubric_item.options:
-                    points_breakdown[rubric_item.id] = float(rubric_item.options[selected_option]['points'])
-                else:
-                    points_breakdown[rubric_item.id] = 0.0
-                    
-        return points_breakdown
+                def score(selected_option, options=rubric_item.options or {}):
+                    if not selected_option:
+                        return 0.0
+                    option = options.get(selected_option, _MISSING)
+                    return 0.0 if option is _MISSING else float(option['points'])
+            else:
+                def score(_grade):
+                    return 0.0
+            
+            scorers.append((rubric_item.id, rubric_item.type == "CHECKBOX", score))
+        
+        return scorers
+    
+    @staticmethod
+    def calculate_human_points(
+        student_grade: StudentGrade,
+        rubric_items: List[RubricItem],
+        scorers: Optional[List[Tuple[str, bool, Callable[[Any], float]]]] = None
+    ) -> Dict[str, float]:
+        """Calculate points earned by human grader for each rubric item."""
+        if scorers is None:
+            scorers = PointsCalculator.build_scorers(rubric_items)
+        
+        # Ungraded items score as None, i.e. unchecked / no option selected
+        get_grade = student_grade.grades.get
+        return {rubric_id: score(get_grade(rubric_id)) for rubric_id, _, score in scorers}
     
     @staticmethod 
-    def calculate_ai_points(ai_result: AIGradingResult, rubric_items: List[RubricItem]) -> Dict[str, float]:
+    def calculate_ai_points(
+        ai_result: AIGradingResult,
+        rubric_items: List[RubricItem],
+        scorers: Optional[List[Tuple[str, bool, Callable[[Any], float]]]] = None
+    ) -> Dict[str, float]:
         """Calculate points earned by AI grader for each rubric item."""
+        if scorers is None:
+            scorers = PointsCalculator.build_scorers(rubric_items)
+        
         points_breakdown = {}
+        get_decision = ai_result.decisions.get
         
-        for rubric_item in rubric_items:
-            if rubric_item.id not in ai_result.decisions:
-                points_breakdown[rubric_item.id] = 0.0  
-                continue
-                
-            decision = ai_result.decisions[rubric_item.id]
+        for rubric_id, is_checkbox, score in scorers:
+            # Missing decisions, verdicts or verdict fields all score 0.0
+            verdict = getattr(get_decision(rubric_id), 'verdict', None)
             
-            if rubric_item.type == "CHECKBOX":
-                # For checkbox: check the decision in the verdict
-                if hasattr(decision, 'verdict') and hasattr(decision.verdict, 'decision'):
-                    # RubricDecision.CHECK means points awarded, CROSS means no points
-                    is_awarded = decision.verdict.decision.value == "CHECK"
-                    points_breakdown[rubric_item.id] = rubric_item.points if is_awarded else 0.0
-                else:
-                    points_breakdown[rubric_item.id] = 0.0
-                    
-            elif rubric_item.type == "RADIO":
+            if is_checkbox:
+                # For checkbox: RubricDecision.CHECK means points awarded, CROSS means no points
+                verdict_decision = getattr(verdict, 'decision', None)
+                points_breakdown[rubric_id] = score(verdict_decision is not None and verdict_decision.value == "CHECK")
+            else:
                 # For radio: get points based on selected option
-                if hasattr(decision, 'verdict') and hasattr(decision.verdict, 'selected_option'):
-                    selected_option = decision.verdict.selected_option
-                    if selected_option and rubric_item.options and selected_option in rubric_item.options:
-                        points_breakdown[rubric_item.id] = float(rubric_item.options[selected_option]['points'])
-                    else:
-                        points_breakdown[rubric_item.id] = 0.0
-                else:
-                    points_breakdown[rubric_item.id] = 0.0
+                points_breakdown[rubric_id] = score(getattr(verdict, 'selected_option', None))
                     
         return points_breakdown
     
@@ -268,29 +618,32 @@ class PointsCalculator:
     ) -> List[PointsComparison]:
         """Compare points between human and AI graders for all submissions."""
         comparisons = []
-        
-        for submission_id in human_grades.keys():
-            if submission_id not in ai_results:
+        if not ai_results:
+            return comparisons
+        scorers = PointsCalculator.build_scorers(rubric_items)
+        get_ai_result = ai_results.get
+        
+        # Walk human_grades in order (not a keys() set intersection, whose iteration
+        # order varies with string hashing) so report rows stay deterministic
+        for submission_id, human_grade in human_grades.items():
+            ai_result = get_ai_result(submission_id, _MISSING)
+            if ai_result is _MISSING:
                 continue
-                
-            human_grade = human_grades[submission_id]
-            ai_result = ai_results[submission_id]
             
             # Calculate points for each grader
-            human_points = PointsCalculator.calculate_human_points(human_grade, rubric_items)
-            ai_points = PointsCalculator.calculate_ai_points(ai_result, rubric_items)
+            human_points = PointsCalculator.calculate_human_points(human_grade, rubric_items, scorers)
+            ai_points = PointsCalculator.calculate_ai_points(ai_result, rubric_items, scorers)
             
             # Calculate totals
             human_total = sum(human_points.values())
             ai_total = sum(ai_points.values())
             
             # Create rubric breakdown
-            rubric_breakdown = {}
-            for rubric_id in human_points.keys():
-                rubric_breakdown[rubric_id] = {
-                    "human": human_points.get(rubric_id, 0.0),
-                    "ai": ai_points.get(rubric_id, 0.0)
-                }
+            get_ai_points = ai_points.get
+            rubric_breakdown = {
+                rubric_id: {"human": human, "ai": get_ai_points(rubric_id, 0.0)}
+                for rubric_id, human in human_points.items()
+            }
             
             comparison = PointsComparison(
                 submission_id=submission_id,
@@ -309,44 +662,56 @@ class PointsCalculator:
         rubric_items: List[RubricItem]
     ) -> List[RubricItemStats]:
         """Calculate statistics for each rubric item."""
-        stats = []
+        # Stage the breakdowns as (submission x rubric) score matrices, masking items a
+        # comparison has no points for, so every statistic is a column reduction
+        shape = (len(comparisons), len(rubric_items))
+        human_matrix = np.zeros(shape)
+        ai_matrix = np.zeros(shape)
+        present = np.zeros(shape, dtype=bool)
+        rubric_ids = [rubric_item.id for rubric_item in rubric_items]
+        
+        for row, comparison in enumerate(comparisons):
+            get_breakdown = comparison.rubric_breakdown.get
+            for col, rubric_id in enumerate(rubric_ids):
+                breakdown = get_breakdown(rubric_id)
+                if breakdown is not None:
+                    human_matrix[row, col] = breakdown["human"]
+                    ai_matrix[row, col] = breakdown["ai"]
+                    present[row, col] = True
+        
+        sample_sizes = present.sum(axis=0)
+        has_samples = sample_sizes > 0
+        has_spread = sample_sizes > 1
+        
+        def column_mean_std(matrix):
+            mean = np.divide(matrix.sum(axis=0), sample_sizes, out=np.zeros(shape[1]), where=has_samples)
+            squared_dev = np.where(present, (matrix - mean) ** 2, 0.0).sum(axis=0)
+            std = np.sqrt(np.divide(squared_dev, sample_sizes - 1, out=np.zeros(shape[1]), where=has_spread))
+            return mean, std
+        
+        human_avg, human_std = column_mean_std(human_matrix)
+        ai_avg, ai_std = column_mean_std(ai_matrix)
+        
+        # For agreement, check if both graders gave same points (accounting for floating point)
+        agreements = (present & (np.abs(human_matrix - ai_matrix) < 0.01)).sum(axis=0)
+        agreement_rate = np.divide(agreements, sample_sizes, out=np.zeros(shape[1]), where=has_samples) * 100
         
-        for rubric_item in rubric_items:
-            human_scores = []
-            ai_scores = []
-            agreements = 0
-            
-            for comparison in comparisons:
-                if rubric_item.id in comparison.rubric_breakdown:
-                    breakdown = comparison.rubric_breakdown[rubric_item.id]
-                    human_scores.append(breakdown["human"])
-                    ai_scores.append(breakdown["ai"])
-                    
-                    # For agreement, check if both graders gave same points
-                    if abs(breakdown["human"] - breakdown["ai"]) < 0.01:  # Account for floating point
-                        agreements += 1
-            
-            if len(human_scores) == 0:
+        stats = []
+        for col, rubric_item in enumerate(rubric_items):
+            if not has_samples[col]:
                 continue
-                
-            # Calculate statistics
-            human_avg = statistics.mean(human_scores)
-            ai_avg = statistics.mean(ai_scores)
-            human_std = statistics.stdev(human_scores) if len(human_scores) > 1 else 0.0
-            ai_std = statistics.stdev(ai_scores) if len(ai_scores) > 1 else 0.0
-            agreement_rate = (agreements / len(human_scores)) * 100 if len(human_scores) > 0 else 0.0
             
             stat = RubricItemStats(
                 rubric_id=rubric_item.id,
                 description=rubric_item.description,
                 rubric_type=rubric_item.type,
                 max_points=rubric_item.points,
-                human_avg=human_avg,
-                ai_avg=ai_avg,
-                human_std=human_std,
-                ai_std=ai_std,
-                agreement_rate=agreement_rate,
-                sample_size=len(human_scores)
+                human_avg=float(human_avg[col]),
+                ai_avg=float(ai_avg[col]),
+                human_std=float(human_std[col]),
+                ai_std=float(ai_std[col]),
+                agreement_rate=float(agreement_rate[col]),
+                sample_size=int(sample_sizes[col])
             )
             stats.append(stat)
             
@@ -359,9 +724,12 @@ class CSVParser:
     # File processing configuration (matching Chrome extension)
     MAX_FILE_SIZE = 1048576  # 1MB in characters
     TEST_FILE_MAX_CONTENT = 100  # characters for test files
-    SUPPORTED_EXTENSIONS = ['.cpp', '.h', '.py', '.java', '.js', '.ts', '.c', '.cc', '.cxx']
+    # Tuples so str.endswith can test every suffix in a single call
+    SUPPORTED_EXTENSIONS = ('.cpp', '.h', '.py', '.java', '.js', '.ts', '.c', '.cc', '.cxx')
+    CORE_SOURCE_EXTENSIONS = ('.cpp', '.h')
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def is_test_file(file_path: str) -> bool:
         """Check if a file is a test file (same logic as Chrome extension)."""
         lower = file_path.lower()
@@ -374,7 +742,7 @@ class CSVParser:
             return False
         
         # Core source files (.cpp and .h) - but check for test patterns
-        if lower.endswith('.cpp') or lower.endswith('.h'):
+        if lower.endswith(CSVParser.CORE_SOURCE_EXTENSIONS):
             # Special case: unit_tests.h is important for grading, don't truncate it
             if base_name == 'unit_tests.h':
                 return False  # Treat as core file (don't truncate)
@@ -384,7 +752,7 @@ class CSVParser:
             return False
         
         # Check if it's a supported extension
-        has_valid_extension = any(lower.endswith(ext) for ext in CSVParser.SUPPORTED_EXTENSIONS)
+        has_valid_extension = lower.endswith(CSVParser.SUPPORTED_EXTENSIONS)
         if not has_valid_extension:
             return True  # Non-source files are considered test files
         
@@ -392,16 +760,26 @@ class CSVParser:
         return True
     
     @staticmethod
-    def process_file_content(file_path: str, content: str) -> str | None:
-        """Process file content with filtering and truncation (same as Chrome extension)."""
+    def process_file_bytes(file_path: str, data: bytes) -> str | None:
+        """Process file content with filtering and truncation (same as Chrome extension).
         
-        # Check for binary data (basic check)
-        if '\0' in content:
+        Raw bytes are checked for binary data before being decoded once.
+        """
+        
+        # Binary files are rejected before paying for a decode (NUL survives decoding unchanged)
+        if b'\0' in data:
             print(f"      ⚠️  Skipping binary file: {file_path}")
             return None
         
-        # Clean line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return CSVParser._clean_file_content(file_path, data.decode('utf-8', errors='ignore'))
+    
+    @staticmethod
+    def _clean_file_content(file_path: str, content: str) -> str:
+        """Normalize line endings and apply the size and test-file limits."""
+        
+        # Clean line endings; files without a CR skip both copies
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         # Apply file size limit
         if len(content) > CSVParser.MAX_FILE_SIZE:
@@ -422,167 +800,234 @@ class CSVParser:
         rubric_items = []
         student_grades = {}
         
+        # Read the file in one pass with the csv module; rows keep their real width, so a
+        # truncated row or an unreached column is never mistaken for an empty cell
         with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-            
-            if len(rows) < 4:
-                raise ValueError(f"CSV file {csv_path} doesn't have enough rows")
-            
-            # Parse headers (first row contains questions)
-            headers = rows[0]
-            
-            # Get point values from last row
-            point_values_row = rows[-1]
-            
-            # Process rubric items from headers
-            radio_groups = {}  # Track radio button groups
-            
-            for col_idx, header in enumerate(headers):
-                if col_idx < 8:  # Skip metadata columns
-                    continue
-                    
-                if not header or header.strip() == "":
-                    continue
-                
-                # Skip columns that are not meant to be graded
-                excluded_columns = ["Adjustment", "Comments", "Grader", "Tags"]
-                if header.strip() in excluded_columns:
-                    continue
-                    
-                # Check if it's a radio button
-                radio_match = re.match(r'\[RADIO (\d+)\](.+)', header)
-                
-                if radio_match:
-                    group_num = radio_match.group(1)
-                    full_description = radio_match.group(2).strip()
-                    
-                    # Extract the common description (before the colon)
-                    parts = full_description.split(':', 1)
-                    if len(parts) == 2:
-                        base_description = parts[0].strip()
-                        option_text = parts[1].strip()
-                    else:
-                        base_description = full_description
-                        option_text = full_description
-                    
-                    # Get point value
-                    try:
-                        points = float(point_values_row[col_idx]) if col_idx < len(point_values_row) else 0.0
-                    except (ValueError, IndexError):
-                        points = 0.0
-                    
-                    if group_num not in radio_groups:
-                        radio_groups[group_num] = {
-                            'description': base_description,
-                            'options': {},
-                            'max_points': 0.0,
-                            'column_indices': [],
-                            'column_to_letter': {}
-                        }
-                    
-                    # Assign QWERTY letter to this option
-                    current_option_count = len(radio_groups[group_num]['options'])
-                    if current_option_count < len(QWERTY_LETTERS):
-                        option_letter = QWERTY_LETTERS[current_option_count]
-                        radio_groups[group_num]['options'][option_letter] = {
-                            'text': option_text,
-                            'points': str(points)
-                        }
-                        radio_groups[group_num]['max_points'] = max(radio_groups[group_num]['max_points'], points)
-                        radio_groups[group_num]['column_indices'].append(col_idx)
-                        # Store mapping from column index to letter for later use
-                        radio_groups[group_num]['column_to_letter'] = radio_groups[group_num].get('column_to_letter', {})
-                        radio_groups[group_num]['column_to_letter'][col_idx] = option_letter
-                
+            rows = list(csv.reader(f))
+        
+        if len(rows) < 4:
+            raise ValueError(f"CSV file {csv_path} doesn't have enough rows")
+        
+        # First row contains questions
+        headers = rows[0]
+        
+        # Skip the metadata columns, blank columns and columns that are not meant to be graded
+        rubric_columns = [
+            col_idx for col_idx in range(METADATA_COLUMN_COUNT, len(headers))
+            if headers[col_idx].strip() and headers[col_idx].strip() not in EXCLUDED_HEADERS
+        ]
+        
+        # Get point values from last row
+        point_values_row = rows[-1]
+        
+        def point_value(col_idx: int) -> float:
+            try:
+                return float(point_values_row[col_idx])
+            except (IndexError, ValueError):
+                return 0.0
+        
+        # Process rubric items from headers
+        radio_groups = {}  # Track radio button groups
+        
+        for col_idx in rubric_columns:
+            header = headers[col_idx]
+
+            # Check if it's a radio button
+            radio_match = RADIO_HEADER_RE.match(header)
+            
+            if radio_match:
+                group_num = radio_match.group(1)
+                full_description = radio_match.group(2).strip()
+                
+                # Extract the common description (before the colon)
+                parts = full_description.split(':', 1)
+                if len(parts) == 2:
+                    base_description = parts[0].strip()
+                    option_text = parts[1].strip()
                 else:
-                    # Regular checkbox item
-                    try:
-                        points = float(point_values_row[col_idx]) if col_idx < len(point_values_row) else 0.0
-                    except (ValueError, IndexError):
-                        points = 0.0
-                        
-                    rubric_item = RubricItem(
-                        id=f"checkbox_{col_idx}",
-                        description=header,
-                        points=points,
-                        type="CHECKBOX",
-                        column_index=col_idx
-                    )
-                    rubric_items.append(rubric_item)
+                    base_description = full_description
+                    option_text = full_description
+                
+                # Get point value
+                points = point_value(col_idx)
+                
+                group = radio_groups.get(group_num)
+                if group is None:
+                    group = radio_groups[group_num] = {
+                        'description': base_description,
+                        'options': {},
+                        'max_points': 0.0,
+                        'column_indices': []
+                    }
+                
+                # Assign QWERTY letter to this option; the option's offset in
+                # column_indices is also its offset in QWERTY_LETTERS
+                current_option_count = len(group['options'])
+                if current_option_count < len(QWERTY_LETTERS):
+                    option_letter = QWERTY_LETTERS[current_option_count]
+                    group['options'][option_letter] = {
+                        'text': option_text,
+                        'points': str(points)
+                    }
+                    group['max_points'] = max(group['max_points'], points)
+                    group['column_indices'].append(col_idx)
             
-            # Add radio groups as rubric items
-            for group_num, group_data in radio_groups.items():
+            else:
+                # Regular checkbox item
+                points = point_value(col_idx)
+                    
                 rubric_item = RubricItem(
-                    id=f"radio_{group_num}",
-                    description=group_data['description'],
-                    points=group_data['max_points'],
-                    type="RADIO",
-                    options=group_data['options'],
-                    column_index=min(group_data['column_indices'])  # Use first column index
+                    id=f"checkbox_{col_idx}",
+                    description=header,
+                    points=points,
+                    type="CHECKBOX",
+                    column_index=col_idx
                 )
                 rubric_items.append(rubric_item)
+        
+        # Add radio groups as rubric items
+        for group_num, group_data in radio_groups.items():
+            rubric_item = RubricItem(
+                id=f"radio_{group_num}",
+                description=group_data['description'],
+                points=group_data['max_points'],
+                type="RADIO",
+                options=group_data['options'],
+                column_index=group_data['column_indices'][0]  # Columns are collected in ascending order
+            )
+            rubric_items.append(rubric_item)
+        
+        # Parse student grades (skip header and last two rows)
+        student_rows = rows[1:len(rows) - 2]
+        student_row_lengths = np.array([len(row) for row in student_rows], dtype=np.int64)
+        
+        # Gather every graded column into one string matrix and test all cells for TRUE at once
+        graded_columns = [
+            rubric_item.column_index for rubric_item in rubric_items if rubric_item.type == "CHECKBOX"
+        ]
+        for group_data in radio_groups.values():
+            graded_columns.extend(group_data['column_indices'])
+        column_position = {col_idx: position for position, col_idx in enumerate(graded_columns)}
+        # Pad or cut each row to the last graded column so the cells form one string matrix
+        width = max(graded_columns, default=-1) + 1
+        padding = [""] * width
+        cells = np.array(
+            [row[:width] if len(row) >= width else row + padding[len(row):] for row in student_rows], dtype=str
+        ).reshape(len(student_rows), width)[:, graded_columns]
+        # Grades repeat a handful of texts: normalize each distinct text once, then map back
+        codes, texts = pd.factorize(cells.ravel())
+        true_matrix = (np.char.upper(np.char.strip(texts.astype(str))) == TRUE_TEXT)[codes].reshape(cells.shape)
+        
+        def true_cells(col_idx: int) -> np.ndarray:
+            return true_matrix[:, column_position[col_idx]]
+        
+        # Per-rubric grade columns, in the order grades were previously recorded:
+        # checkbox items first, then radio groups. A checkbox is only graded on rows that reach its column.
+        grade_columns = []
+        for rubric_item in rubric_items:
+            if rubric_item.type == "CHECKBOX":
+                checked = true_cells(rubric_item.column_index).astype(object)
+                checked[student_row_lengths <= rubric_item.column_index] = None
+                grade_columns.append((rubric_item.id, checked.tolist()))
+        for group_num, group_data in radio_groups.items():
+            selected_letters = np.full(len(student_rows), None, dtype=object)
+            # Walk options last to first so the first TRUE option wins
+            column_indices = group_data['column_indices']
+            for offset in reversed(range(len(column_indices))):
+                selected_letters[true_cells(column_indices[offset])] = QWERTY_LETTERS[offset]
+            grade_columns.append((f"radio_{group_num}", selected_letters.tolist()))
+        
+        for row_idx, row in enumerate(student_rows):
+            # Truncated rows (fewer than the metadata columns) are not student records
+            if len(row) < METADATA_COLUMN_COUNT or not row[0]:
+                continue
+            submission_id = row[0]
             
-            # Parse student grades (skip header and last two rows)
-            for row_idx in range(1, len(rows) - 2):
-                row = rows[row_idx]
-                if len(row) < 8:
-                    continue
-                    
-                submission_id = row[0]
-                name = row[2] if len(row) > 2 else ""
-                
-                if not submission_id or submission_id == "":
-                    continue
-                
-                grades = {}
-                
-                # Process checkbox items
-                for rubric_item in rubric_items:
-                    if rubric_item.type == "CHECKBOX":
-                        col_idx = rubric_item.column_index
-                        if col_idx < len(row):
-                            value = row[col_idx].strip().upper()
-                            grades[rubric_item.id] = value == "TRUE"
-                
-                # Process radio items
-                for group_num, group_data in radio_groups.items():
-                    radio_id = f"radio_{group_num}"
-                    selected_letter = None
-                    
-                    for col_idx in group_data['column_indices']:
-                        if col_idx < len(row) and row[col_idx].strip().upper() == "TRUE":
-                            # Get the letter for this column
-                            selected_letter = group_data['column_to_letter'].get(col_idx)
-                            break
-                    
-                    if selected_letter:
-                        grades[radio_id] = selected_letter
-                
-                student_grades[submission_id] = StudentGrade(
-                    submission_id=submission_id,
-                    name=name,
-                    grades=grades
-                )
+            grades = {}
+            for rubric_id, column in grade_columns:
+                value = column[row_idx]
+                # Checkbox grades are recorded when the row has the column; radio grades only when an option is selected
+                if value is not None:
+                    grades[rubric_id] = value
+            
+            student_grades[submission_id] = StudentGrade(
+                submission_id=submission_id,
+                name=row[2],
+                grades=grades
+            )
         
         return rubric_items, student_grades
 
 
+def intern_text(value: Any) -> Any:
+    """Intern strings (decisions, rubric ids) that are compared and hashed over and over."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize a backend request body straight to UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode('utf-8')
+
+
+def format_json(obj: Any) -> str:
+    """Pretty-print a JSON value for debug logging."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse a JSON document from the backend."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class BackendClient:
     """Client for interacting with the grading backend."""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", compress_requests: bool = False):
         self.base_url = base_url
+        # Only enable for backends that accept Content-Encoding: gzip request bodies
+        self.compress_requests = compress_requests
         self.session = None
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # One pooled session for every request so keep-alive connections are reused
+        connector = aiohttp.TCPConnector(
+            limit=BACKEND_CONNECTION_LIMIT,
+            limit_per_host=BACKEND_CONNECTION_LIMIT,
+            keepalive_timeout=BACKEND_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=BACKEND_DNS_CACHE_TTL
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
-            
+    
+    async def check_health(self) -> Dict[str, Any]:
+        """Ping the backend health endpoint and return its status payload."""
+        async with self.session.get(
+            f"{self.base_url}/api/v1/health",
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status != 200:
+                raise Exception(f"Backend returned status {response.status}")
+            return await response.json()
+            
+    async def _encode_request_body(self, request_data: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize a request, gzipping large bodies off the event loop when enabled."""
+        body = dumps_json(request_data)
+        headers = {"Content-Type": "application/json"}
+        if self.compress_requests and len(body) >= GZIP_MIN_REQUEST_BYTES:
+            body = await asyncio.to_thread(gzip.compress, body, GZIP_COMPRESSION_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
+    
     async def grade_submission(
         self,
         assignment_context: Dict[str, str],
@@ -597,53 +1042,65 @@ class BackendClient:
             "rubric_items": rubric_items
         }
         
-        # Log the complete request for debugging
-        logger.info(f"=== SENDING REQUEST TO BACKEND ===")
-        logger.info(f"URL: {self.base_url}/api/v1/grade-submission")
-        logger.info(f"Assignment Context: {json.dumps(assignment_context, indent=2)}")
-        logger.info(f"Number of source files: {len(source_files)}")
-        logger.info(f"Source files: {list(source_files.keys())}")
-        logger.info(f"Number of rubric items: {len(rubric_items)}")
-        logger.info(f"Rubric items structure:")
-        for i, item in enumerate(rubric_items):
-            logger.info(f"  Item {i+1}: {json.dumps(item, indent=4)}")
-        
-        # Log complete request JSON (truncated source files for readability)
-        debug_request = request_data.copy()
-        debug_request["source_files"] = {
-            filename: f"[{len(content)} characters]" if len(content) > 200 
-            else content for filename, content in source_files.items()
-        }
-        logger.info(f"Complete request JSON structure:")
-        logger.info(json.dumps(debug_request, indent=2))
+        # Log the request for debugging
+        logger.info("=== SENDING REQUEST TO BACKEND ===")
+        logger.info("URL: %s/api/v1/grade-submission", self.base_url)
+        logger.info("Number of source files: %d", len(source_files))
+        logger.info("Source files: %s", list(source_files))
+        logger.info("Number of rubric items: %d", len(rubric_items))
+        
+        # Pretty-printed JSON dumps are only built when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Assignment Context: %s", format_json(assignment_context))
+            logger.debug("Rubric items structure:")
+            for i, item in enumerate(rubric_items):
+                logger.debug("  Item %d: %s", i + 1, format_json(item))
+            
+            # Log complete request JSON (truncated source files for readability)
+            debug_request = request_data.copy()
+            debug_request["source_files"] = {
+                filename: f"[{len(content)} characters]" if len(content) > 200 
+                else content for filename, content in source_files.items()
+            }
+            logger.debug("Complete request JSON structure:")
+            logger.debug(format_json(debug_request))
         
         results = []
         
         try:
+            body, headers = await self._encode_request_body(request_data)
             async with self.session.post(
                 f"{self.base_url}/api/v1/grade-submission",
-                json=request_data,
+                data=body,
+                headers=headers,
                 timeout=aiohttp.ClientTimeout(total=300)  # 5 minute timeout
             ) as response:
-                logger.info(f"=== BACKEND RESPONSE ===")
-                logger.info(f"Status: {response.status}")
-                logger.info(f"Headers: {dict(response.headers)}")
+                logger.info("=== BACKEND RESPONSE ===")
+                logger.info("Status: %s", response.status)
+                logger.info("Headers: %s", response.headers)
                 
                 if response.status != 200:
                     error_text = await response.text()
-                    logger.error(f"Backend error response: {error_text}")
+                    logger.error("Backend error response: %s", error_text)
                     raise Exception(f"Backend returned status {response.status}: {error_text}")
                 
                 logger.info("Starting to parse Server-Sent Events...")
                 # Parse Server-Sent Events
-                async for line in response.content:
-                    line = line.decode('utf-8').strip()
-                    logger.debug(f"Received SSE line: {line}")
-                    if line.startswith('data: '):
-                        data_str = line[6:]  # Remove 'data: ' prefix
+                # Read one SSE line at a time and keep it as bytes; JSON is parsed from bytes directly
+                while True:
+                    raw_line = await response.content.readline()
+                    if not raw_line:
+                        break
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    logger.debug("Received SSE line: %s", line)
+                    if line.startswith(b'data: '):
+                        data_bytes = line[6:]  # Remove 'data: ' prefix
                         try:
-                            data = json.loads(data_str)
-                            logger.info(f"Parsed SSE data: {json.dumps(data, indent=2)}")
+                            data = loads_json(data_bytes)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Parsed SSE data: %s", format_json(data))
                             if data.get('type') == 'partial_result' and data.get('decision'):
                                 decision = data['decision']
                                 verdict = decision.get('verdict', {})
@@ -656,22 +1113,140 @@ class BackendClient:
                                 
                                 result = EvaluationResult(
                                     submission_id=assignment_context['submission_id'],
-                                    rubric_id=decision['rubric_item_id'],
-                                    decision=result_decision,
+                                    rubric_id=intern_text(decision['rubric_item_id']),
+                                    decision=intern_text(result_decision),
                                     confidence=verdict.get('confidence', 0) / 100.0,  # Convert to 0-1
                                     comment=verdict.get('comment', ''),
                                     evidence=verdict.get('evidence', {})
                                 )
                                 results.append(result)
-                                logger.info(f"Added result for rubric {decision['rubric_item_id']}: {result_decision}")
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse JSON from SSE data: {data_str}, error: {e}")
+                                logger.info("Added result for rubric %s: %s", decision['rubric_item_id'], result_decision)
+                        except ValueError as e:  # Both json and orjson decode errors subclass ValueError
+                            logger.warning("Failed to parse JSON from SSE data: %s, error: %s", data_bytes, e)
                             continue
                             
         except Exception as e:
             print(f"Error grading submission {assignment_context['submission_id']}: {str(e)}")
             
         return results
+    
+    async def grade_batch(
+        self,
+        tasks: List[EvaluationTask],
+        concurrency: int = DEFAULT_CONCURRENT_BATCH_SIZE,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[Optional[List[EvaluationResult]]]:
+        """Grade tasks over the shared session with at most `concurrency` requests in flight.
+        
+        Pass `semaphore` instead to share one in-flight limit between batches graded at
+        the same time. Results line up with `tasks`; a task whose request raised gets None.
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(concurrency)
+        
+        async def grade_one(task: EvaluationTask) -> Optional[List[EvaluationResult]]:
+            async with semaphore:
+                try:
+                    return await self.grade_submission(
+                        assignment_context=task.assignment_context,
+                        source_files=task.source_files,
+                        rubric_items=task.rubric_items
+                    )
+                except Exception as e:
+                    print(f"❌ Student {task.student_id} ({task.project_name}/{task.csv_name}) failed: {type(e).__name__}: {e}")
+                    return None
+        
+        return await asyncio.gather(*(grade_one(task) for task in tasks))
+
+
+def accuracy_band(accuracy: float) -> Tuple[str, PatternFill]:
+    """Performance label and shared fill for an accuracy percentage, by ACCURACY_BANDS."""
+    for minimum, label, fill in ACCURACY_BANDS:
+        if accuracy >= minimum:
+            return label, fill
+    return POOR_ACCURACY_BAND
+
+
+def accuracy_fill(accuracy: float) -> PatternFill:
+    """Shared fill for an accuracy percentage, by ACCURACY_BANDS."""
+    return accuracy_band(accuracy)[1]
+
+
+def set_column_widths(ws, widths: List[float]) -> None:
+    """Set the widths of the leading columns in order (before the first append on write-only sheets)."""
+    column_dimensions = ws.column_dimensions
+    for letter, width in zip(COLUMN_LETTERS, widths):
+        column_dimensions[letter].width = width
+
+
+def set_uniform_column_width(ws, count: int, width: float) -> None:
+    """Give the first `count` columns one width, written as a single <col> span."""
+    dimension = ws.column_dimensions['A']
+    dimension.min, dimension.max = 1, count
+    dimension.width = width
+
+
+# Named styles grid_cell_factory registered on each workbook, keyed by (fill, font, alignment)
+_grid_style_names: "weakref.WeakKeyDictionary[Any, Dict[Tuple[Any, Any, Any], str]]" = weakref.WeakKeyDictionary()
+
+
+def grid_cell(ws, value, fill=None, font=None, alignment=None) -> WriteOnlyCell:
+    """Create a thin-bordered data cell."""
+    return make_cell(ws, value, font=font, fill=fill, border=THIN_BORDER, alignment=alignment)
+
+
+def grid_cell_factory(ws, fill=None, font=None, alignment=None) -> Callable[[Any], WriteOnlyCell]:
+    """Cell constructor for one grid_cell style, so per-row loops only pass the value.
+    
+    The style is registered on the workbook once as a complete named style; each cell then
+    applies it by name instead of hashing its border, fill, font and alignment again.
+    """
+    wb = ws.parent
+    style_names = _grid_style_names.setdefault(wb, {})
+    key = (fill, font, alignment)
+    style_name = style_names.get(key)
+    if style_name is None:
+        style_name = style_names[key] = f"Grid {len(style_names) + 1}"
+        wb.add_named_style(NamedStyle(
+            name=style_name,
+            font=font if font is not None else DEFAULT_FONT,
+            fill=fill if fill is not None else PatternFill(),
+            border=THIN_BORDER,
+            alignment=alignment if alignment is not None else Alignment()
+        ))
+
+    def new_cell(value):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style_name
+        return cell
+
+    return new_cell
+
+
+def make_cell(ws, value, font=None, fill=None, border=None, alignment=None, number_format=None) -> WriteOnlyCell:
+    """Create a styled cell for appending to a write-only worksheet."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def header_cells(
+    ws, headers, font=HEADER_FONT, fill=HEADER_FILL, border=THIN_BORDER, alignment=None
+) -> List[WriteOnlyCell]:
+    """Styled header row, ready for a single ws.append."""
+    return [
+        make_cell(ws, header, font=font, fill=fill, border=border, alignment=alignment)
+        for header in headers
+    ]
 
 
 class ExcelReportGenerator:
@@ -679,7 +1254,6 @@ class ExcelReportGenerator:
     
     def __init__(self):
         self.wb = None
-        self.ws = None
         
     def create_report(
         self,
@@ -691,22 +1265,9 @@ class ExcelReportGenerator:
     ):
         """Create Excel report with comparison visualization."""
         
-        self.wb = openpyxl.Workbook()
-        self.ws = self.wb.active
-        self.ws.title = project_name[:31]  # Excel sheet name limit
-        
-        # Define styles
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        match_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Green
-        false_positive_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
-        false_negative_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Yellow
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        # Rows are streamed straight to disk; write-only workbooks start without a sheet
+        self.wb = openpyxl.Workbook(write_only=True)
+        ws = self.wb.create_sheet(title=project_name[:31])  # Excel sheet name limit
         
         # Create headers
         headers = ["Submission ID", "Student Name"]
@@ -719,97 +1280,80 @@ class ExcelReportGenerator:
             headers.append("Comment")
             headers.append("Match?")
         
+        # Adjust column widths (must happen before the first row is written)
+        set_uniform_column_width(ws, len(headers), 15)
+        
         # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = self.ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            cell.border = border
-        
-        # Process each student
-        row_idx = 2
-        for submission_id, student_grade in human_grades.items():
+        ws.append(header_cells(ws, headers, alignment=CENTER_WRAP_ALIGNMENT))
+        
+        # Resolve the few student-cell styles once per sheet (fills are matched by identity)
+        bordered_cell = grid_cell_factory(ws)
+        comment_cell = grid_cell_factory(ws, alignment=WRAP_ALIGNMENT)
+        filled_cells = {id(fill): grid_cell_factory(ws, fill=fill) for fill in STUDENT_RESULT_FILLS}
+
+        def missing_cells(human_text):
+            # No backend result: the three backend columns stay empty rather than holding placeholders
+            return (bordered_cell(human_text), None, None, None, bordered_cell("NO DATA"))
+
+        def result_cells(human_text, backend_value, backend_result, match_text, fill):
+            filled_cell = filled_cells[id(fill)]
+            return (
+                filled_cell(human_text),
+                filled_cell(backend_value),
+                bordered_cell(f"{backend_result.confidence * 100:.1f}"),
+                comment_cell(backend_result.comment),
+                filled_cell(match_text),
+            )
+
+        def checkbox_cells(human_value, backend_result):
+            human_text = "TRUE" if human_value else "FALSE"
+            if not backend_result:
+                return missing_cells(human_text)
+
+            backend_bool = backend_result.decision == CHECK_DECISION
+            match_text, fill = CHECKBOX_OUTCOMES[bool(human_value)][backend_bool]
+            backend_value = BOOL_TEXT[backend_bool]
+            return result_cells(human_text, backend_value, backend_result, match_text, fill)
+
+        def radio_cells(human_value, backend_result):
+            human_text = str(human_value)
+            if not backend_result:
+                return missing_cells(human_text)
+
+            # For radio buttons, compare letters
+            if human_text == backend_result.decision:
+                match_text, fill = "MATCH", MATCH_FILL
+            else:
+                match_text, fill = "MISMATCH", FALSE_POSITIVE_FILL
+            return result_cells(human_text, backend_result.decision, backend_result, match_text, fill)
+
+        # Resolve the CHECKBOX/RADIO branch once per rubric item instead of per cell
+        rubric_writers = [
+            (rubric_item.id, checkbox_cells if rubric_item.type == "CHECKBOX" else radio_cells)
+            for rubric_item in rubric_items
+        ]
+
+        # One rubric_id -> result lookup and one row of human grades per student,
+        # shared by the rows and the summary sheet
+        backend_index = index_backend_results(backend_results)
+        human_rows = human_grade_rows(rubric_items, human_grades)
+
+        # Process each student, building the whole row before appending it once
+        append_row = ws.append
+        for (submission_id, student_grade), human_row in zip(human_grades.items(), human_rows):
             # Basic info
-            self.ws.cell(row=row_idx, column=1, value=submission_id).border = border
-            self.ws.cell(row=row_idx, column=2, value=student_grade.name).border = border
-            
+            row = [bordered_cell(submission_id), bordered_cell(student_grade.name)]
+
             # Get backend results for this student
-            student_backend_results = backend_results.get(submission_id, [])
-            backend_by_rubric = {r.rubric_id: r for r in student_backend_results}
-            
-            col_idx = 3
-            for rubric_item in rubric_items:
-                # Human grade
-                human_value = student_grade.grades.get(rubric_item.id, False)
-                
-                if rubric_item.type == "CHECKBOX":
-                    human_cell = self.ws.cell(row=row_idx, column=col_idx, value="TRUE" if human_value else "FALSE")
-                else:  # RADIO
-                    human_cell = self.ws.cell(row=row_idx, column=col_idx, value=str(human_value))
-                human_cell.border = border
-                
-                # Backend result
-                backend_result = backend_by_rubric.get(rubric_item.id)
-                
-                if backend_result:
-                    if rubric_item.type == "CHECKBOX":
-                        backend_value = "TRUE" if backend_result.decision == "check" else "FALSE"
-                    else:  # RADIO
-                        backend_value = backend_result.decision
-                    
-                    backend_cell = self.ws.cell(row=row_idx, column=col_idx + 1, value=backend_value)
-                    confidence_cell = self.ws.cell(row=row_idx, column=col_idx + 2, value=f"{backend_result.confidence * 100:.1f}")
-                    comment_cell = self.ws.cell(row=row_idx, column=col_idx + 3, value=backend_result.comment)
-                    
-                    # Check if match
-                    if rubric_item.type == "CHECKBOX":
-                        human_bool = human_value
-                        backend_bool = backend_result.decision == "check"
-                        match = human_bool == backend_bool
-                        
-                        if match:
-                            match_text = "MATCH"
-                            fill = match_fill
-                        elif human_bool and not backend_bool:
-                            match_text = "FALSE NEGATIVE"
-                            fill = false_negative_fill
-                        else:
-                            match_text = "FALSE POSITIVE"
-                            fill = false_positive_fill
-                    else:  # RADIO
-                        # For radio buttons, compare letters
-                        match = str(human_value) == backend_result.decision
-                        match_text = "MATCH" if match else "MISMATCH"
-                        fill = match_fill if match else false_positive_fill
-                    
-                    match_cell = self.ws.cell(row=row_idx, column=col_idx + 4, value=match_text)
-                    
-                    # Apply formatting
-                    for cell in [human_cell, backend_cell, match_cell]:
-                        cell.fill = fill
-                        cell.border = border
-                    
-                    confidence_cell.border = border
-                    comment_cell.border = border
-                    comment_cell.alignment = Alignment(wrap_text=True)
-                else:
-                    # No backend result
-                    self.ws.cell(row=row_idx, column=col_idx + 1, value="N/A").border = border
-                    self.ws.cell(row=row_idx, column=col_idx + 2, value="N/A").border = border
-                    self.ws.cell(row=row_idx, column=col_idx + 3, value="No result").border = border
-                    self.ws.cell(row=row_idx, column=col_idx + 4, value="NO DATA").border = border
-                
-                col_idx += 5
-            
-            row_idx += 1
-        
+            get_backend_result = backend_index.get(submission_id, {}).get
+
+            for (rubric_id, write_cells), human_value in zip(rubric_writers, human_row):
+                row.extend(write_cells(human_value, get_backend_result(rubric_id)))
+
+            append_row(row)
+
         # Add summary statistics
-        self.add_summary_sheet(rubric_items, human_grades, backend_results)
-        
-        # Adjust column widths
-        for col in range(1, self.ws.max_column + 1):
-            self.ws.column_dimensions[get_column_letter(col)].width = 15
+        self.add_summary_sheet(rubric_items, human_grades, backend_results, backend_index, human_rows)
         
         # Save
         self.wb.save(output_path)
@@ -818,97 +1362,78 @@ class ExcelReportGenerator:
         self,
         rubric_items: List[RubricItem],
         human_grades: Dict[str, StudentGrade],
-        backend_results: Dict[str, List[EvaluationResult]]
+        backend_results: Dict[str, List[EvaluationResult]],
+        backend_index: Optional[Dict[str, Dict[str, EvaluationResult]]] = None,
+        human_rows: Optional[List[List[Any]]] = None
     ):
         """Add summary statistics sheet."""
         
         summary_ws = self.wb.create_sheet("Summary")
         
         # Calculate statistics
-        stats = []
-        for rubric_item in rubric_items:
-            total = 0
-            matches = 0
-            false_positives = 0
-            false_negatives = 0
-            no_data = 0
-            avg_confidence = 0
-            confidence_count = 0
-            
-            for submission_id, student_grade in human_grades.items():
-                total += 1
-                human_value = student_grade.grades.get(rubric_item.id, False)
-                
-                backend_results_student = backend_results.get(submission_id, [])
-                backend_result = next((r for r in backend_results_student if r.rubric_id == rubric_item.id), None)
-                
-                if backend_result:
-                    avg_confidence += backend_result.confidence
-                    confidence_count += 1
-                    
-                    if rubric_item.type == "CHECKBOX":
-                        human_bool = human_value
-                        backend_bool = backend_result.decision == "check"
-                        
-                        if human_bool == backend_bool:
-                            matches += 1
-                        elif human_bool and not backend_bool:
-                            false_negatives += 1
-                        else:
-                            false_positives += 1
-                    else:  # RADIO
-                        # For radio buttons, compare letters
-                        if str(human_value) == backend_result.decision:
-                            matches += 1
-                        else:
-                            false_positives += 1  # Treat all mismatches as false positives for radio
-                else:
-                    no_data += 1
-            
-            if confidence_count > 0:
-                avg_confidence /= confidence_count
-            
-            stats.append({
-                'rubric': rubric_item.description[:100],
-                'type': rubric_item.type,
-                'total': total,
-                'matches': matches,
-                'false_positives': false_positives,
-                'false_negatives': false_negatives,
-                'no_data': no_data,
-                'accuracy': matches / (total - no_data) if (total - no_data) > 0 else 0,
-                'avg_confidence': avg_confidence
-            })
+        stats = compute_rubric_summary_stats(rubric_items, human_grades, backend_results, backend_index, human_rows)
         
         # Write summary
         headers = ["Rubric Item", "Type", "Total", "Matches", "False Positives", "False Negatives", 
                    "No Data", "Accuracy %", "Avg Confidence %"]
         
-        for col, header in enumerate(headers, 1):
-            cell = summary_ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
+        # Adjust column widths (must happen before the first row is written)
+        set_column_widths(summary_ws, [20] * len(headers))
         
-        for row, stat in enumerate(stats, 2):
-            summary_ws.cell(row=row, column=1, value=stat['rubric'])
-            summary_ws.cell(row=row, column=2, value=stat['type'])
-            summary_ws.cell(row=row, column=3, value=stat['total'])
-            summary_ws.cell(row=row, column=4, value=stat['matches'])
-            summary_ws.cell(row=row, column=5, value=stat['false_positives'])
-            summary_ws.cell(row=row, column=6, value=stat['false_negatives'])
-            summary_ws.cell(row=row, column=7, value=stat['no_data'])
-            summary_ws.cell(row=row, column=8, value=f"{stat['accuracy'] * 100:.1f}")
-            summary_ws.cell(row=row, column=9, value=f"{stat['avg_confidence'] * 100:.1f}")
+        summary_ws.append(header_cells(summary_ws, headers, font=BOLD_FONT, fill=None, border=None))
         
-        # Adjust column widths
-        for col in range(1, 10):
-            summary_ws.column_dimensions[get_column_letter(col)].width = 20
+        # One append per stats row instead of nine cell() lookups
+        for stat in stats:
+            summary_ws.append([
+                stat['rubric'][:100],
+                stat['type'],
+                stat['total'],
+                stat['matches'],
+                stat['false_positives'],
+                stat['false_negatives'],
+                stat['no_data'],
+                f"{stat['accuracy'] * 100:.1f}",
+                f"{stat['avg_confidence'] * 100:.1f}"
+            ])
 
 
 class CrossProjectUnifiedReportGenerator:
     """Generates a unified Excel report with statistics from all evaluated assignments."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = DEFAULT_REPORT_WORKERS):
         self.wb = None
+        self.max_workers = max_workers
+        self._stats_cache = {}
+    
+    @staticmethod
+    def _precompute_assignment_stats(eval_data: Dict) -> Dict[str, Any]:
+        """Per-rubric counts for one assignment, plus totals overall and per rubric type."""
+        rubric_stats = compute_rubric_summary_stats(
+            eval_data['rubric_items'], eval_data['human_grades'], eval_data['backend_results']
+        )
+        
+        def totals(stats):
+            # Counts over (student, rubric) pairs that have a backend result
+            return {
+                'matches': sum(stat['matches'] for stat in stats),
+                'count': sum(stat['total'] - stat['no_data'] for stat in stats),
+                'confidence_sum': sum(stat['confidence_sum'] for stat in stats),
+            }
+        
+        return {
+            'rubric_stats': rubric_stats,
+            'overall': totals(rubric_stats),
+            'checkbox': totals([stat for stat in rubric_stats if stat['type'] == "CHECKBOX"]),
+            'radio': totals([stat for stat in rubric_stats if stat['type'] != "CHECKBOX"]),
+        }
+    
+    def _assignment_stats(self, eval_data: Dict) -> Dict[str, Any]:
+        """Precomputed stats for an assignment, shared by every sheet of the report."""
+        key = id(eval_data)
+        stats = self._stats_cache.get(key)
+        if stats is None:
+            stats = self._stats_cache[key] = self._precompute_assignment_stats(eval_data)
+        return stats
     
     def create_cross_project_report(
         self,
@@ -917,60 +1442,66 @@ class CrossProjectUnifiedReportGenerator:
     ):
         """Create unified Excel report with statistics from all projects."""
         
-        self.wb = openpyxl.Workbook()
-        # Remove default sheet
-        default_sheet = self.wb.active
-        self.wb.remove(default_sheet)
-        
-        # Define styles
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        subheader_fill = PatternFill(start_color="B4C6E7", end_color="B4C6E7", fill_type="solid")
-        excellent_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Green
-        good_fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")  # Light blue
-        fair_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Yellow
-        poor_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        # Rows are streamed straight to disk; write-only workbooks start without a sheet
+        self.wb = openpyxl.Workbook(write_only=True)
+        
+        # Every sheet is a view of the same per-assignment reduction; compute it once
+        assignments = [
+            eval_data
+            for evaluation_data_list in all_project_data.values()
+            for eval_data in evaluation_data_list
+        ]
+        if self.max_workers > 1 and len(assignments) > 1:
+            # Assignments are independent, so the reduction spreads across processes;
+            # the sheets are still written here since a workbook can't be shared
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                assignment_stats = list(executor.map(self._precompute_assignment_stats, assignments))
+        else:
+            assignment_stats = [self._precompute_assignment_stats(eval_data) for eval_data in assignments]
+        self._stats_cache = {
+            id(eval_data): stats for eval_data, stats in zip(assignments, assignment_stats)
+        }
         
         # Create overview summary sheet
         print("      📊 Creating overview summary sheet...")
-        self._create_overview_sheet(all_project_data, header_fill, header_font, border)
+        self._create_overview_sheet(all_project_data)
         print("      ✅ Overview summary sheet completed")
         
         # Create detailed statistics sheet  
         print("      📋 Creating detailed statistics sheet...")
-        self._create_detailed_stats_sheet(all_project_data, header_fill, header_font, subheader_fill, border)
+        self._create_detailed_stats_sheet(all_project_data)
         print("      ✅ Detailed statistics sheet completed")
         
         # Create project comparison sheet
         print("      📈 Creating project comparison sheet...")
-        self._create_project_comparison_sheet(all_project_data, header_fill, header_font, border)
+        self._create_project_comparison_sheet(all_project_data)
         print("      ✅ Project comparison sheet completed")
         
         # Create rubric analysis sheet
         print("      🎯 Creating rubric analysis sheet...")
-        self._create_rubric_analysis_sheet(all_project_data, header_fill, header_font, border)
+        self._create_rubric_analysis_sheet(all_project_data)
         print("      ✅ Rubric analysis sheet completed")
         
         # Save the workbook
         print("      💾 Saving Excel file...")
         self.wb.save(output_path)
+        self._stats_cache = {}
         print("      ✅ Excel file saved successfully")
         
-    def _create_overview_sheet(self, all_project_data, header_fill, header_font, border):
+    def _create_overview_sheet(self, all_project_data):
         """Create overview summary sheet with key statistics."""
         
         ws = self.wb.create_sheet("OVERVIEW_SUMMARY")
+        # Data cells share one registered grid style; only the accuracy fill varies per row
+        bordered_cell = grid_cell_factory(ws)
+        
+        # Adjust column widths (must happen before the first row is written)
+        set_column_widths(ws, [15, 25, 15, 15, 12, 12, 12, 12])
         
         # Title
-        title_cell = ws.cell(row=1, column=1, value="Cross-Project Evaluation Summary")
-        title_cell.font = Font(size=16, bold=True)
-        ws.merge_cells('A1:H1')
+        ws.append([make_cell(ws, "Cross-Project Evaluation Summary", font=TITLE_FONT)])
+        ws.merged_cells.add('A1:H1')
+        ws.append([])
         
         # Headers
         headers = [
@@ -978,65 +1509,36 @@ class CrossProjectUnifiedReportGenerator:
             "Accuracy Rate", "Avg Confidence", "Checkbox Items", "Radio Items"
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.border = border
+        ws.append(header_cells(ws, headers))
         
-        row = 4
         total_students = 0
         total_items = 0
         total_accuracy_sum = 0
         total_confidence_sum = 0
         project_count = 0
+        n_projects = len(all_project_data)
         
         for project_idx, (project_name, evaluation_data_list) in enumerate(all_project_data.items(), 1):
-            print(f"         📊 Processing project {project_idx}/{len(all_project_data)}: {project_name}")
+            print(f"         📊 Processing project {project_idx}/{n_projects}: {project_name}")
             for eval_data in evaluation_data_list:
                 csv_name = eval_data['csv_name']
                 rubric_items = eval_data['rubric_items']
                 human_grades = eval_data['human_grades']
-                backend_results = eval_data['backend_results']
                 
                 # Calculate statistics
                 students_evaluated = len(human_grades)
                 total_rubric_items = len(rubric_items)
-                checkbox_items = len([r for r in rubric_items if r.type == "CHECKBOX"])
-                radio_items = len([r for r in rubric_items if r.type == "RADIO"])
+                checkbox_items = sum(1 for r in rubric_items if r.type == "CHECKBOX")
+                radio_items = total_rubric_items - checkbox_items
                 
                 # Calculate accuracy and confidence
-                matches = 0
-                total_comparisons = 0
-                confidence_sum = 0
-                confidence_count = 0
-                
-                for student_id, student_grade in human_grades.items():
-                    backend_results_student = backend_results.get(student_id, [])
-                    
-                    # Create a lookup dictionary for this student's backend results to optimize performance
-                    backend_lookup = {r.rubric_id: r for r in backend_results_student}
-                    
-                    for rubric_item in rubric_items:
-                        backend_result = backend_lookup.get(rubric_item.id)
-                        
-                        if backend_result:
-                            total_comparisons += 1
-                            confidence_sum += backend_result.confidence
-                            confidence_count += 1
-                            
-                            human_value = student_grade.grades.get(rubric_item.id, False)
-                            
-                            if rubric_item.type == "CHECKBOX":
-                                backend_bool = backend_result.decision == "check"
-                                if human_value == backend_bool:
-                                    matches += 1
-                            else:  # RADIO
-                                if str(human_value) == backend_result.decision:
-                                    matches += 1
+                overall = self._assignment_stats(eval_data)['overall']
+                matches = overall['matches']
+                total_comparisons = overall['count']
+                confidence_sum = overall['confidence_sum']
                 
                 accuracy_rate = (matches / total_comparisons * 100) if total_comparisons > 0 else 0
-                avg_confidence = (confidence_sum / confidence_count * 100) if confidence_count > 0 else 0
+                avg_confidence = (confidence_sum / total_comparisons * 100) if total_comparisons > 0 else 0
                 
                 # Write data
                 data = [
@@ -1044,20 +1546,11 @@ class CrossProjectUnifiedReportGenerator:
                     f"{accuracy_rate:.1f}%", f"{avg_confidence:.1f}%", checkbox_items, radio_items
                 ]
                 
-                for col, value in enumerate(data, 1):
-                    cell = ws.cell(row=row, column=col, value=value)
-                    cell.border = border
-                    
-                    # Color code accuracy
-                    if col == 5:  # Accuracy column
-                        if accuracy_rate >= 90:
-                            cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                        elif accuracy_rate >= 80:
-                            cell.fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
-                        elif accuracy_rate >= 70:
-                            cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                        else:
-                            cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                row_cells = [bordered_cell(value) for value in data]
+                
+                row_cells[4].fill = accuracy_fill(accuracy_rate)  # Color code accuracy
+                
+                ws.append(row_cells)
                 
                 # Accumulate totals
                 total_students += students_evaluated
@@ -1065,40 +1558,32 @@ class CrossProjectUnifiedReportGenerator:
                 total_accuracy_sum += accuracy_rate
                 total_confidence_sum += avg_confidence
                 project_count += 1
-                
-                row += 1
         
         # Add summary row
-        row += 1
+        ws.append([])
         summary_headers = ["TOTALS/AVERAGES", "", f"{total_students}", f"{total_items}", 
                           f"{total_accuracy_sum/project_count:.1f}%" if project_count > 0 else "0%",
                           f"{total_confidence_sum/project_count:.1f}%" if project_count > 0 else "0%", "", ""]
         
-        for col, value in enumerate(summary_headers, 1):
-            cell = ws.cell(row=row, column=col, value=value)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")
-            cell.border = border
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 25
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 12
-        ws.column_dimensions['F'].width = 12
-        ws.column_dimensions['G'].width = 12
-        ws.column_dimensions['H'].width = 12
-    
-    def _create_detailed_stats_sheet(self, all_project_data, header_fill, header_font, subheader_fill, border):
+        ws.append([
+            grid_cell(ws, value, font=BOLD_FONT, fill=TOTALS_FILL)
+            for value in summary_headers
+        ])
+    
+    def _create_detailed_stats_sheet(self, all_project_data):
         """Create detailed statistics sheet with per-rubric-item analysis."""
         
         ws = self.wb.create_sheet("DETAILED_STATISTICS")
+        # Data cells share one registered grid style; only the accuracy fill varies per row
+        bordered_cell = grid_cell_factory(ws)
+        
+        # Adjust column widths (must happen before the first row is written)
+        set_column_widths(ws, [15, 25, 40, 10, 8, 10, 12, 12, 10, 12])
         
         # Title
-        title_cell = ws.cell(row=1, column=1, value="Detailed Rubric Item Analysis")
-        title_cell.font = Font(size=16, bold=True)
-        ws.merge_cells('A1:J1')
+        ws.append([make_cell(ws, "Detailed Rubric Item Analysis", font=TITLE_FONT)])
+        ws.merged_cells.add('A1:J1')
+        ws.append([])
         
         # Headers
         headers = [
@@ -1106,104 +1591,46 @@ class CrossProjectUnifiedReportGenerator:
             "Matches", "False Positives", "False Negatives", "Accuracy", "Avg Confidence"
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.border = border
-        
-        row = 4
+        ws.append(header_cells(ws, headers))
+        append_row = ws.append
         
         for project_name, evaluation_data_list in all_project_data.items():
             for eval_data in evaluation_data_list:
                 csv_name = eval_data['csv_name']
                 rubric_items = eval_data['rubric_items']
-                human_grades = eval_data['human_grades']
-                backend_results = eval_data['backend_results']
+                rubric_stats = self._assignment_stats(eval_data)['rubric_stats']
                 
-                for rubric_item in rubric_items:
-                    matches = 0
-                    false_positives = 0
-                    false_negatives = 0
-                    total = 0
-                    confidence_sum = 0
-                    confidence_count = 0
-                    
-                    for student_id, student_grade in human_grades.items():
-                        backend_results_student = backend_results.get(student_id, [])
-                        backend_result = next((r for r in backend_results_student if r.rubric_id == rubric_item.id), None)
-                        
-                        if backend_result:
-                            total += 1
-                            confidence_sum += backend_result.confidence
-                            confidence_count += 1
-                            
-                            human_value = student_grade.grades.get(rubric_item.id, False)
-                            
-                            if rubric_item.type == "CHECKBOX":
-                                human_bool = human_value
-                                backend_bool = backend_result.decision == "check"
-                                
-                                if human_bool == backend_bool:
-                                    matches += 1
-                                elif not human_bool and backend_bool:
-                                    false_positives += 1
-                                else:
-                                    false_negatives += 1
-                            else:  # RADIO
-                                if str(human_value) == backend_result.decision:
-                                    matches += 1
-                                else:
-                                    false_positives += 1
-                    
-                    accuracy = (matches / total * 100) if total > 0 else 0
-                    avg_confidence = (confidence_sum / confidence_count * 100) if confidence_count > 0 else 0
+                for rubric_item, stat in zip(rubric_items, rubric_stats):
+                    accuracy = stat['accuracy'] * 100
+                    avg_confidence = stat['avg_confidence'] * 100
                     
                     # Write data
                     data = [
-                        project_name, csv_name, rubric_item.description[:50] + "..." if len(rubric_item.description) > 50 else rubric_item.description,
-                        rubric_item.type, rubric_item.points, matches, false_positives, false_negatives,
+                        project_name, csv_name, shorten(rubric_item.description, 50),
+                        rubric_item.type, rubric_item.points, stat['matches'], stat['false_positives'], stat['false_negatives'],
                         f"{accuracy:.1f}%", f"{avg_confidence:.1f}%"
                     ]
                     
-                    for col, value in enumerate(data, 1):
-                        cell = ws.cell(row=row, column=col, value=value)
-                        cell.border = border
-                        
-                        # Color code accuracy
-                        if col == 9:  # Accuracy column
-                            if accuracy >= 90:
-                                cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                            elif accuracy >= 80:
-                                cell.fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
-                            elif accuracy >= 70:
-                                cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                            else:
-                                cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                    row_cells = [bordered_cell(value) for value in data]
+                    
+                    row_cells[8].fill = accuracy_fill(accuracy)  # Color code accuracy
                     
-                    row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 25
-        ws.column_dimensions['C'].width = 40
-        ws.column_dimensions['D'].width = 10
-        ws.column_dimensions['E'].width = 8
-        ws.column_dimensions['F'].width = 10
-        ws.column_dimensions['G'].width = 12
-        ws.column_dimensions['H'].width = 12
-        ws.column_dimensions['I'].width = 10
-        ws.column_dimensions['J'].width = 12
-    
-    def _create_project_comparison_sheet(self, all_project_data, header_fill, header_font, border):
+                    append_row(row_cells)
+    
+    def _create_project_comparison_sheet(self, all_project_data):
         """Create project comparison sheet showing summary by project."""
         
         ws = self.wb.create_sheet("PROJECT_COMPARISON")
+        # Data cells share one registered grid style; only the accuracy fill varies per row
+        bordered_cell = grid_cell_factory(ws)
+        
+        # Adjust column widths (must happen before the first row is written)
+        set_column_widths(ws, [20, 15, 15, 15, 15, 15, 20, 20, 30])
         
         # Title
-        title_cell = ws.cell(row=1, column=1, value="Project Comparison Summary")
-        title_cell.font = Font(size=16, bold=True)
-        ws.merge_cells('A1:I1')
+        ws.append([make_cell(ws, "Project Comparison Summary", font=TITLE_FONT)])
+        ws.merged_cells.add('A1:I1')
+        ws.append([])
         
         # Headers
         headers = [
@@ -1211,27 +1638,22 @@ class CrossProjectUnifiedReportGenerator:
             "Overall Accuracy", "Avg Confidence", "Best Assignment", "Worst Assignment", "Notes"
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.border = border
-        
-        row = 4
+        ws.append(header_cells(ws, headers))
         
         for project_name, evaluation_data_list in all_project_data.items():
             total_assignments = len(evaluation_data_list)
             total_students = 0
             total_items = 0
-            accuracy_scores = []
-            confidence_scores = []
-            assignment_accuracies = []
+            accuracy_sum = 0.0
+            confidence_score_sum = 0.0
+            # Best keeps the first assignment with the top accuracy, worst the last with the lowest
+            best_assignment = worst_assignment = "N/A"
+            best_accuracy = worst_accuracy = None
             
             for eval_data in evaluation_data_list:
                 csv_name = eval_data['csv_name']
                 rubric_items = eval_data['rubric_items']
                 human_grades = eval_data['human_grades']
-                backend_results = eval_data['backend_results']
                 
                 students_count = len(human_grades)
                 items_count = len(rubric_items)
@@ -1239,47 +1661,26 @@ class CrossProjectUnifiedReportGenerator:
                 total_items += items_count
                 
                 # Calculate accuracy for this assignment
-                matches = 0
-                total_comparisons = 0
-                confidence_sum = 0
-                confidence_count = 0
-                
-                for student_id, student_grade in human_grades.items():
-                    backend_results_student = backend_results.get(student_id, [])
-                    
-                    for rubric_item in rubric_items:
-                        backend_result = next((r for r in backend_results_student if r.rubric_id == rubric_item.id), None)
-                        
-                        if backend_result:
-                            total_comparisons += 1
-                            confidence_sum += backend_result.confidence
-                            confidence_count += 1
-                            
-                            human_value = student_grade.grades.get(rubric_item.id, False)
-                            
-                            if rubric_item.type == "CHECKBOX":
-                                backend_bool = backend_result.decision == "check"
-                                if human_value == backend_bool:
-                                    matches += 1
-                            else:  # RADIO
-                                if str(human_value) == backend_result.decision:
-                                    matches += 1
+                overall = self._assignment_stats(eval_data)['overall']
+                matches = overall['matches']
+                total_comparisons = overall['count']
+                confidence_sum = overall['confidence_sum']
                 
                 assignment_accuracy = (matches / total_comparisons * 100) if total_comparisons > 0 else 0
-                assignment_confidence = (confidence_sum / confidence_count * 100) if confidence_count > 0 else 0
+                assignment_confidence = (confidence_sum / total_comparisons * 100) if total_comparisons > 0 else 0
                 
-                accuracy_scores.append(assignment_accuracy)
-                confidence_scores.append(assignment_confidence)
-                assignment_accuracies.append((csv_name, assignment_accuracy))
+                accuracy_sum += assignment_accuracy
+                confidence_score_sum += assignment_confidence
+                
+                # Track best and worst assignments in the same pass
+                if best_accuracy is None or assignment_accuracy > best_accuracy:
+                    best_assignment, best_accuracy = csv_name, assignment_accuracy
+                if worst_accuracy is None or assignment_accuracy <= worst_accuracy:
+                    worst_assignment, worst_accuracy = csv_name, assignment_accuracy
             
             # Calculate overall statistics
-            overall_accuracy = sum(accuracy_scores) / len(accuracy_scores) if accuracy_scores else 0
-            avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
-            
-            # Find best and worst assignments
-            assignment_accuracies.sort(key=lambda x: x[1], reverse=True)
-            best_assignment = assignment_accuracies[0][0] if assignment_accuracies else "N/A"
-            worst_assignment = assignment_accuracies[-1][0] if assignment_accuracies else "N/A"
+            overall_accuracy = accuracy_sum / total_assignments if total_assignments else 0
+            avg_confidence = confidence_score_sum / total_assignments if total_assignments else 0
             
             # Generate notes
             notes = []
@@ -1306,187 +1707,79 @@ class CrossProjectUnifiedReportGenerator:
                 best_assignment, worst_assignment, "; ".join(notes)
             ]
             
-            for col, value in enumerate(data, 1):
-                cell = ws.cell(row=row, column=col, value=value)
-                cell.border = border
-                
-                # Color code overall accuracy
-                if col == 5:  # Overall accuracy column
-                    if overall_accuracy >= 90:
-                        cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                    elif overall_accuracy >= 80:
-                        cell.fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
-                    elif overall_accuracy >= 70:
-                        cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                    else:
-                        cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-            
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 15
-        ws.column_dimensions['G'].width = 20
-        ws.column_dimensions['H'].width = 20
-        ws.column_dimensions['I'].width = 30
-    
-    def _create_rubric_analysis_sheet(self, all_project_data, header_fill, header_font, border):
+            row_cells = [bordered_cell(value) for value in data]
+            
+            row_cells[4].fill = accuracy_fill(overall_accuracy)  # Color code accuracy
+            
+            ws.append(row_cells)
+    
+    def _create_rubric_analysis_sheet(self, all_project_data):
         """Create rubric type analysis sheet."""
         
         ws = self.wb.create_sheet("RUBRIC_TYPE_ANALYSIS")
+        # Data cells share one registered grid style; only the accuracy fill varies per row
+        bordered_cell = grid_cell_factory(ws)
+        
+        # Adjust column widths (must happen before the first row is written)
+        set_column_widths(ws, [20, 25, 12, 15, 12, 15])
         
         # Title
-        title_cell = ws.cell(row=1, column=1, value="Rubric Type Performance Analysis")
-        title_cell.font = Font(size=16, bold=True)
-        ws.merge_cells('A1:F1')
+        ws.append([make_cell(ws, "Rubric Type Performance Analysis", font=TITLE_FONT)])
+        ws.merged_cells.add('A1:F1')
         
-        # Collect statistics by rubric type
-        checkbox_stats = []
-        radio_stats = []
+        # Collect statistics by rubric type, one table per type
+        sections = (("CHECKBOX ITEMS ANALYSIS", 'checkbox'), ("RADIO ITEMS ANALYSIS", 'radio'))
+        section_stats = {type_key: [] for _, type_key in sections}
         
         for project_name, evaluation_data_list in all_project_data.items():
             for eval_data in evaluation_data_list:
                 csv_name = eval_data['csv_name']
-                rubric_items = eval_data['rubric_items']
-                human_grades = eval_data['human_grades']
-                backend_results = eval_data['backend_results']
-                
-                checkbox_matches = 0
-                checkbox_total = 0
-                checkbox_confidence = 0
-                checkbox_count = 0
-                
-                radio_matches = 0
-                radio_total = 0
-                radio_confidence = 0
-                radio_count = 0
-                
-                for rubric_item in rubric_items:
-                    for student_id, student_grade in human_grades.items():
-                        backend_results_student = backend_results.get(student_id, [])
-                        backend_result = next((r for r in backend_results_student if r.rubric_id == rubric_item.id), None)
-                        
-                        if backend_result:
-                            human_value = student_grade.grades.get(rubric_item.id, False)
-                            
-                            if rubric_item.type == "CHECKBOX":
-                                checkbox_total += 1
-                                checkbox_confidence += backend_result.confidence
-                                checkbox_count += 1
-                                
-                                backend_bool = backend_result.decision == "check"
-                                if human_value == backend_bool:
-                                    checkbox_matches += 1
-                            
-                            else:  # RADIO
-                                radio_total += 1
-                                radio_confidence += backend_result.confidence
-                                radio_count += 1
-                                
-                                if str(human_value) == backend_result.decision:
-                                    radio_matches += 1
-                
-                if checkbox_total > 0:
-                    checkbox_stats.append({
-                        'project': project_name,
-                        'assignment': csv_name,
-                        'accuracy': checkbox_matches / checkbox_total * 100,
-                        'confidence': checkbox_confidence / checkbox_count * 100,
-                        'total': checkbox_total
-                    })
-                
-                if radio_total > 0:
-                    radio_stats.append({
-                        'project': project_name,
-                        'assignment': csv_name,
-                        'accuracy': radio_matches / radio_total * 100,
-                        'confidence': radio_confidence / radio_count * 100,
-                        'total': radio_total
-                    })
-        
-        # Headers for checkbox analysis
-        row = 3
-        ws.cell(row=row, column=1, value="CHECKBOX ITEMS ANALYSIS").font = Font(bold=True, size=12)
-        row += 1
+                assignment_stats = self._assignment_stats(eval_data)
+                
+                for type_key, type_stats in section_stats.items():
+                    totals = assignment_stats[type_key]
+                    count = totals['count']
+                    if count > 0:
+                        type_stats.append({
+                            'project': project_name,
+                            'assignment': csv_name,
+                            'accuracy': totals['matches'] / count * 100,
+                            'confidence': totals['confidence_sum'] / count * 100,
+                            'total': count
+                        })
         
         headers = ["Project", "Assignment", "Accuracy", "Avg Confidence", "Total Items", "Performance"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.border = border
-        
-        row += 1
-        for stat in checkbox_stats:
-            performance = "Excellent" if stat['accuracy'] >= 90 else "Good" if stat['accuracy'] >= 80 else "Fair" if stat['accuracy'] >= 70 else "Poor"
-            data = [stat['project'], stat['assignment'], f"{stat['accuracy']:.1f}%", 
-                   f"{stat['confidence']:.1f}%", stat['total'], performance]
-            
-            for col, value in enumerate(data, 1):
-                cell = ws.cell(row=row, column=col, value=value)
-                cell.border = border
+        
+        # Checkbox analysis, then radio analysis two rows further down
+        for section_index, (section_title, type_key) in enumerate(sections):
+            ws.append([])
+            if section_index:
+                ws.append([])
+            ws.append([make_cell(ws, section_title, font=SECTION_FONT)])
+            ws.append(header_cells(ws, headers))
+            
+            for stat in section_stats[type_key]:
+                performance, fill = accuracy_band(stat['accuracy'])
+                data = [stat['project'], stat['assignment'], f"{stat['accuracy']:.1f}%", 
+                       f"{stat['confidence']:.1f}%", stat['total'], performance]
                 
-                if col == 3:  # Accuracy column
-                    if stat['accuracy'] >= 90:
-                        cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                    elif stat['accuracy'] >= 80:
-                        cell.fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
-                    elif stat['accuracy'] >= 70:
-                        cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                    else:
-                        cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-            
-            row += 1
-        
-        # Add spacing and radio analysis
-        row += 2
-        ws.cell(row=row, column=1, value="RADIO ITEMS ANALYSIS").font = Font(bold=True, size=12)
-        row += 1
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.border = border
-        
-        row += 1
-        for stat in radio_stats:
-            performance = "Excellent" if stat['accuracy'] >= 90 else "Good" if stat['accuracy'] >= 80 else "Fair" if stat['accuracy'] >= 70 else "Poor"
-            data = [stat['project'], stat['assignment'], f"{stat['accuracy']:.1f}%", 
-                   f"{stat['confidence']:.1f}%", stat['total'], performance]
-            
-            for col, value in enumerate(data, 1):
-                cell = ws.cell(row=row, column=col, value=value)
-                cell.border = border
+                row_cells = [bordered_cell(value) for value in data]
                 
-                if col == 3:  # Accuracy column
-                    if stat['accuracy'] >= 90:
-                        cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                    elif stat['accuracy'] >= 80:
-                        cell.fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
-                    elif stat['accuracy'] >= 70:
-                        cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                    else:
-                        cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-            
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 25
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 12
-        ws.column_dimensions['F'].width = 15
+                row_cells[2].fill = fill  # Color code accuracy
+                
+                ws.append(row_cells)
 
 
 class UnifiedExcelReportGenerator:
     """Generates unified Excel reports combining multiple CSV evaluations."""
     
+    SUMMARY_HEADERS = ["CSV File", "Rubric Item", "Type", "Total", "Matches", "False Positives",
+                       "False Negatives", "No Data", "Accuracy %", "Avg Confidence %"]
+    SUBMISSION_POINTS_HEADERS = ["CSV File", "Submission ID", "Human Total", "AI Total",
+                                 "Difference (AI-Human)", "% Difference", "Status"]
+    RUBRIC_POINTS_HEADERS = ["CSV File", "Rubric Item", "Type", "Max Points", "Human Avg", "AI Avg",
+                             "Difference", "Human Std", "AI Std", "Agreement %", "Sample Size"]
+    
     def __init__(self):
         self.wb = None
     
@@ -1498,23 +1791,9 @@ class UnifiedExcelReportGenerator:
     ):
         """Create unified Excel report with separate sheets for each CSV and combined summary."""
         
-        self.wb = openpyxl.Workbook()
-        # Remove default sheet
-        default_sheet = self.wb.active
-        self.wb.remove(default_sheet)
-        
-        # Define styles
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        match_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Green
-        false_positive_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
-        false_negative_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Yellow
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        # Rows are streamed straight to disk; write-only workbooks start without a sheet
+        self.wb = openpyxl.Workbook(write_only=True)
+        all_stats = []
         
         # Create sheet for each CSV evaluation
         for eval_data in all_evaluation_data:
@@ -1527,117 +1806,272 @@ class UnifiedExcelReportGenerator:
             sheet_name = csv_name[:31] if len(csv_name) > 31 else csv_name
             ws = self.wb.create_sheet(title=sheet_name)
             
-            # Create headers
-            headers = ["Submission ID", "Student Name"]
-            for rubric_item in rubric_items:
-                headers.append(rubric_item.description)  # Full description
-                headers.append("Backend Decision")
-                headers.append("Confidence %")
-                headers.append("Comment")
-                headers.append("Match?")
+            headers = self._student_headers(rubric_items)
+            
+            # Adjust column widths (must happen before the first row is written)
+            set_uniform_column_width(ws, len(headers), 15)
             
             # Write headers
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-                cell.border = border
-            
-            # Process each student
-            row_idx = 2
-            for submission_id, student_grade in human_grades.items():
-                # Basic info
-                ws.cell(row=row_idx, column=1, value=submission_id).border = border
-                ws.cell(row=row_idx, column=2, value=student_grade.name).border = border
-                
-                # Get backend results for this student
-                student_backend_results = backend_results.get(submission_id, [])
-                backend_by_rubric = {r.rubric_id: r for r in student_backend_results}
-                
-                col_idx = 3
-                for rubric_item in rubric_items:
-                    # Human grade
-                    human_value = student_grade.grades.get(rubric_item.id, False)
-                    
-                    if rubric_item.type == "CHECKBOX":
-                        human_cell = ws.cell(row=row_idx, column=col_idx, value="TRUE" if human_value else "FALSE")
-                    else:  # RADIO
-                        human_cell = ws.cell(row=row_idx, column=col_idx, value=str(human_value))
-                    human_cell.border = border
-                    
-                    # Backend result
-                    backend_result = backend_by_rubric.get(rubric_item.id)
-                    
-                    if backend_result:
-                        if rubric_item.type == "CHECKBOX":
-                            backend_value = "TRUE" if backend_result.decision == "check" else "FALSE"
-                        else:  # RADIO
-                            backend_value = backend_result.decision
-                        
-                        backend_cell = ws.cell(row=row_idx, column=col_idx + 1, value=backend_value)
-                        confidence_cell = ws.cell(row=row_idx, column=col_idx + 2, value=f"{backend_result.confidence * 100:.1f}")
-                        comment_cell = ws.cell(row=row_idx, column=col_idx + 3, value=backend_result.comment)
-                        
-                        # Check if match
-                        if rubric_item.type == "CHECKBOX":
-                            human_bool = human_value
-                            backend_bool = backend_result.decision == "check"
-                            match = human_bool == backend_bool
-                            
-                            if match:
-                                match_text = "MATCH"
-                                fill = match_fill
-                            elif human_bool and not backend_bool:
-                                match_text = "FALSE NEGATIVE"
-                                fill = false_negative_fill
-                            else:
-                                match_text = "FALSE POSITIVE"
-                                fill = false_positive_fill
-                        else:  # RADIO
-                            # For radio buttons, compare letters
-                            match = str(human_value) == backend_result.decision
-                            match_text = "MATCH" if match else "MISMATCH"
-                            fill = match_fill if match else false_positive_fill
-                        
-                        match_cell = ws.cell(row=row_idx, column=col_idx + 4, value=match_text)
-                        
-                        # Apply formatting
-                        for cell in [human_cell, backend_cell, match_cell]:
-                            cell.fill = fill
-                            cell.border = border
-                        
-                        confidence_cell.border = border
-                        comment_cell.border = border
-                        comment_cell.alignment = Alignment(wrap_text=True)
+            ws.append(header_cells(ws, headers, alignment=CENTER_WRAP_ALIGNMENT))
+            
+            # Index backend results once; the student rows look up every cell through it
+            backend_index = index_backend_results(backend_results)
+            append_row = ws.append
+            # Every student cell uses one of a handful of styles; resolve each once.
+            # Row fills are the shared module constants, so identity picks the style.
+            bordered_cell = grid_cell_factory(ws)
+            comment_cell = grid_cell_factory(ws, alignment=WRAP_ALIGNMENT)
+            filled_cells = {id(fill): grid_cell_factory(ws, fill=fill) for fill in STUDENT_RESULT_FILLS}
+            # The row pass records the human grade and backend result behind every cell for the summary statistics
+            human_rows = []
+            result_rows = []
+            for submission_id, name, rubric_cells in self._iter_student_rows(
+                rubric_items, human_grades, backend_index, human_rows, result_rows
+            ):
+                row_cells = [bordered_cell(submission_id), bordered_cell(name)]
+                extend_row = row_cells.extend
+                
+                for human_text, backend_value, confidence_text, comment, match_text, fill in rubric_cells:
+                    if fill is None:
+                        # No backend result: leave the placeholder backend columns unwritten
+                        extend_row((bordered_cell(human_text), None, None, None, bordered_cell(match_text)))
                     else:
-                        # No backend result
-                        ws.cell(row=row_idx, column=col_idx + 1, value="N/A").border = border
-                        ws.cell(row=row_idx, column=col_idx + 2, value="N/A").border = border
-                        ws.cell(row=row_idx, column=col_idx + 3, value="No result").border = border
-                        ws.cell(row=row_idx, column=col_idx + 4, value="NO DATA").border = border
-                    
-                    col_idx += 5
+                        filled_cell = filled_cells[id(fill)]
+                        extend_row((
+                            filled_cell(human_text),
+                            filled_cell(backend_value),
+                            bordered_cell(confidence_text),
+                            comment_cell(comment),
+                            filled_cell(match_text),
+                        ))
                 
-                row_idx += 1
+                append_row(row_cells)
             
-            # Adjust column widths
-            for col in range(1, ws.max_column + 1):
-                ws.column_dimensions[get_column_letter(col)].width = 15
+            all_stats.extend(self._csv_summary_stats(csv_name, rubric_items, human_grades, backend_results,
+                                                     human_rows=human_rows, result_rows=result_rows))
         
         # Create comprehensive summary sheet
-        self.create_comprehensive_summary_sheet(all_evaluation_data)
+        self.create_comprehensive_summary_sheet(all_evaluation_data, all_stats)
+        
+        # Create points comparison sheets
+        self.create_points_comparison_sheets(all_evaluation_data)
+        
+        # Save the workbook
+        self.wb.save(output_path)
+    
+    def create_unified_csv_report(
+        self,
+        project_name: str,
+        all_evaluation_data: List[Dict],
+        output_path: Path
+    ) -> Path:
+        """Write the per-CSV and summary tables as plain CSV files, skipping all styling."""
+        all_stats = []
+        
+        for eval_data in all_evaluation_data:
+            csv_name = eval_data['csv_name']
+            rubric_items = eval_data['rubric_items']
+            human_grades = eval_data['human_grades']
+            backend_results = eval_data['backend_results']
+            csv_path = output_path.with_name(f"{output_path.stem}_{csv_name}.csv")
+            backend_index = index_backend_results(backend_results)
+            human_rows = []
+            result_rows = []
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(self._student_headers(rubric_items))
+                for submission_id, name, rubric_cells in self._iter_student_rows(
+                    rubric_items, human_grades, backend_index, human_rows, result_rows
+                ):
+                    row = [submission_id, name]
+                    for cells in rubric_cells:
+                        row.extend(cells[:5])
+                    writer.writerow(row)
+            all_stats.extend(self._csv_summary_stats(csv_name, rubric_items, human_grades, backend_results,
+                                                     human_rows=human_rows, result_rows=result_rows))
+        
+        summary_path = output_path.with_suffix('.csv')
+        with open(summary_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.SUMMARY_HEADERS)
+            writer.writerows(self._iter_summary_rows(all_stats))
+        
+        # Points tables, matching the POINTS_BY_SUBMISSION and RUBRIC_POINTS_ANALYSIS sheets
+        all_comparisons, all_rubric_stats = self._collect_points_data(all_evaluation_data)
+        if all_comparisons:
+            with open(output_path.with_name(f"{output_path.stem}_POINTS_BY_SUBMISSION.csv"), 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(self.SUBMISSION_POINTS_HEADERS)
+                for comp, pct_diff, status_code in self._iter_submission_points(all_comparisons):
+                    writer.writerow([
+                        comp.csv_name, comp.submission_id,
+                        f"{comp.human_total:.1f}", f"{comp.ai_total:.1f}", f"{comp.difference:.1f}",
+                        f"{pct_diff:.1f}" if pct_diff is not None else "N/A",
+                        POINTS_DIFFERENCE_STATUSES[status_code][0],
+                    ])
+            with open(output_path.with_name(f"{output_path.stem}_RUBRIC_POINTS_ANALYSIS.csv"), 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(self.RUBRIC_POINTS_HEADERS)
+                for stat, difference, _ in self._iter_rubric_points(all_rubric_stats):
+                    writer.writerow([
+                        stat.csv_name, shorten(stat.description, 50), stat.rubric_type, f"{stat.max_points:.1f}",
+                        f"{stat.human_avg:.2f}", f"{stat.ai_avg:.2f}", f"{difference:.2f}",
+                        f"{stat.human_std:.2f}", f"{stat.ai_std:.2f}", f"{stat.agreement_rate:.1f}",
+                        stat.sample_size,
+                    ])
+        
+        return summary_path
+    
+    @staticmethod
+    def _student_headers(rubric_items: List[RubricItem]) -> List[str]:
+        """Header row for a per-CSV student sheet."""
+        headers = ["Submission ID", "Student Name"]
+        for rubric_item in rubric_items:
+            headers.append(rubric_item.description)  # Full description
+            headers.append("Backend Decision")
+            headers.append("Confidence %")
+            headers.append("Comment")
+            headers.append("Match?")
+        return headers
+    
+    @staticmethod
+    def _iter_student_rows(
+        rubric_items: List[RubricItem],
+        human_grades: Dict[str, StudentGrade],
+        backend_index: Dict[str, Dict[str, EvaluationResult]],
+        human_rows: Optional[List[List[Any]]] = None,
+        result_rows: Optional[List[List[Optional[EvaluationResult]]]] = None
+    ):
+        """Yield (submission_id, name, rubric_cells) per student.
+        
+        Each rubric cell is (human, backend, confidence, comment, match, fill); the backend,
+        confidence, comment and fill are None when the backend returned no result for that item.
+        When `human_rows` and `result_rows` are given, each student's grades (False where
+        ungraded) and looked-up results (None where missing) are appended to them so
+        compute_rubric_summary_stats can count them without a second pass.
+        """
+        def checkbox_cell(human_value, backend_result):
+            human_text = BOOL_TEXT[bool(human_value)]
+            if not backend_result:
+                # Backend, confidence and comment stay empty in every report format
+                return (human_text, None, None, None, "NO DATA", None)
+            backend_bool = backend_result.decision == CHECK_DECISION
+            match_text, fill = CHECKBOX_OUTCOMES[bool(human_value)][backend_bool]
+            return (human_text, BOOL_TEXT[backend_bool], f"{backend_result.confidence * 100:.1f}",
+                    backend_result.comment, match_text, fill)
+        
+        def radio_cell(human_value, backend_result):
+            human_text = str(human_value)
+            if not backend_result:
+                return (human_text, None, None, None, "NO DATA", None)
+            # For radio buttons, compare letters; every mismatch counts as a false positive
+            if human_text == backend_result.decision:
+                match_text, fill = "MATCH", MATCH_FILL
+            else:
+                match_text, fill = "MISMATCH", FALSE_POSITIVE_FILL
+            return (human_text, backend_result.decision, f"{backend_result.confidence * 100:.1f}",
+                    backend_result.comment, match_text, fill)
+        
+        # Resolve the CHECKBOX/RADIO branch once per rubric item instead of per cell
+        rubric_cell_builders = [
+            (rubric_item.id, checkbox_cell if rubric_item.type == "CHECKBOX" else radio_cell)
+            for rubric_item in rubric_items
+        ]
+        
+        for submission_id, student_grade in human_grades.items():
+            # Get backend results for this student (first result per rubric item wins)
+            get_backend_result = backend_index.get(submission_id, {}).get
+            get_grade = student_grade.grades.get
+            
+            rubric_cells = []
+            row_grades = []
+            row_results = []
+            for rubric_id, build_cell in rubric_cell_builders:
+                human_value = get_grade(rubric_id, False)
+                backend_result = get_backend_result(rubric_id)
+                row_grades.append(human_value)
+                row_results.append(backend_result)
+                rubric_cells.append(build_cell(human_value, backend_result))
+            
+            if human_rows is not None:
+                human_rows.append(row_grades)
+            if result_rows is not None:
+                result_rows.append(row_results)
+            yield submission_id, student_grade.name, rubric_cells
+    
+    @staticmethod
+    def _csv_summary_stats(
+        csv_name: str,
+        rubric_items: List[RubricItem],
+        human_grades: Dict[str, StudentGrade],
+        backend_results: Dict[str, List[EvaluationResult]],
+        backend_index: Optional[Dict[str, Dict[str, EvaluationResult]]] = None,
+        human_rows: Optional[List[List[Any]]] = None,
+        result_rows: Optional[List[List[Optional[EvaluationResult]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """compute_rubric_summary_stats for one CSV, tagged with the CSV name."""
+        stats = compute_rubric_summary_stats(
+            rubric_items, human_grades, backend_results, backend_index, human_rows, result_rows
+        )
+        for stat in stats:
+            stat['csv_name'] = csv_name
+        return stats
+    
+    @staticmethod
+    def _collect_summary_stats(all_evaluation_data: List[Dict]) -> List[Dict[str, Any]]:
+        """Per-rubric agreement statistics for every CSV, tagged with the CSV name."""
+        all_stats = []
         
-        # Create points comparison sheets
-        self.create_points_comparison_sheets(all_evaluation_data)
+        for eval_data in all_evaluation_data:
+            csv_name = eval_data['csv_name']
+            rubric_items = eval_data['rubric_items']
+            human_grades = eval_data['human_grades']
+            backend_results = eval_data['backend_results']
+            
+            all_stats.extend(
+                UnifiedExcelReportGenerator._csv_summary_stats(csv_name, rubric_items, human_grades, backend_results)
+            )
         
-        # Save the workbook
-        self.wb.save(output_path)
+        return all_stats
+    
+    @staticmethod
+    def _iter_summary_rows(all_stats: List[Dict[str, Any]]):
+        """Yield the comprehensive summary table rows as plain values."""
+        for stat in all_stats:
+            yield [
+                stat['csv_name'],
+                stat['rubric'],
+                stat['type'],
+                stat['total'],
+                stat['matches'],
+                stat['false_positives'],
+                stat['false_negatives'],
+                stat['no_data'],
+                f"{stat['accuracy'] * 100:.1f}",
+                f"{stat['avg_confidence'] * 100:.1f}",
+            ]
     
     def create_points_comparison_sheets(self, all_evaluation_data: List[Dict]):
         """Create sheets with points comparison analysis."""
+        all_comparisons, all_rubric_stats = self._collect_points_data(all_evaluation_data)
+        
+        if not all_comparisons:
+            return
+        
+        # Create submissions points comparison sheet
+        self.create_submissions_points_sheet(all_comparisons)
+        
+        # Create rubric items points analysis sheet
+        self.create_rubric_points_analysis_sheet(all_rubric_stats)
         
-        # Collect all points comparisons and stats across all CSVs
+        # Create overall points summary sheet
+        self.create_points_summary_sheet(all_comparisons, all_rubric_stats)
+    
+    @staticmethod
+    def _collect_points_data(
+        all_evaluation_data: List[Dict]
+    ) -> Tuple[List[PointsComparison], List[RubricItemStats]]:
+        """Points comparisons and rubric stats for every CSV, tagged with the CSV name."""
         all_comparisons = []
         all_rubric_stats = []
         
@@ -1649,23 +2083,11 @@ class UnifiedExcelReportGenerator:
             backend_results = eval_data['backend_results']
             
             # Convert backend results to AIGradingResult format
-            ai_results = {}
-            for submission_id, results_list in backend_results.items():
-                ai_decisions = {}
-                for result in results_list:
-                    # Create mock decision object
-                    decision = type('obj', (object,), {
-                        'verdict': type('obj', (object,), {
-                            'decision': type('obj', (object,), {'value': 'CHECK' if result.decision == 'check' else 'CROSS'})() if result.rubric_id.startswith('checkbox') else None,
-                            'selected_option': result.decision if result.rubric_id.startswith('radio') else None
-                        })()
-                    })()
-                    ai_decisions[result.rubric_id] = decision
-                
-                ai_results[submission_id] = AIGradingResult(
-                    submission_id=submission_id,
-                    decisions=ai_decisions
-                )
+            rubric_types = rubric_types_by_id(rubric_items)
+            ai_results = {
+                submission_id: ai_grading_result(submission_id, results_list, rubric_types)
+                for submission_id, results_list in backend_results.items()
+            }
             
             # Calculate points comparisons for this CSV
             if ai_results:
@@ -1681,178 +2103,145 @@ class UnifiedExcelReportGenerator:
                 all_comparisons.extend(comparisons)
                 all_rubric_stats.extend(stats)
         
-        if not all_comparisons:
-            return
+        return all_comparisons, all_rubric_stats
+    
+    @staticmethod
+    def _iter_submission_points(comparisons: List[PointsComparison]):
+        """Yield (comparison, % difference or None when undefined, status code), largest discrepancy first."""
+        # Percentage difference and status for every comparison at once, as columns
+        human_totals, ai_totals, differences = comparison_arrays(comparisons)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct_diffs = np.where(
+                human_totals > 0, differences / human_totals * 100, np.where(ai_totals == 0, 0.0, np.inf)
+            )
+        status_codes = points_difference_codes(differences)
         
-        # Create submissions points comparison sheet
-        self.create_submissions_points_sheet(all_comparisons)
+        # Largest discrepancies first; a stable sort keeps ties in input order
+        order = np.argsort(-np.abs(differences), kind='stable')
         
-        # Create rubric items points analysis sheet
-        self.create_rubric_points_analysis_sheet(all_rubric_stats)
+        for index, pct_diff, status_code in zip(order.tolist(), pct_diffs[order].tolist(), status_codes[order].tolist()):
+            yield comparisons[index], (pct_diff if pct_diff != float('inf') else None), status_code
+    
+    @staticmethod
+    def _iter_rubric_points(stats: List[RubricItemStats]):
+        """Yield (stat, AI - human average, status code), most problematic first."""
+        # AI - human average per rubric item, as one column
+        averages = np.array([(stat.ai_avg, stat.human_avg) for stat in stats], dtype=np.float64).reshape(-1, 2)
+        differences = averages[:, 0] - averages[:, 1]
+        status_codes = points_difference_codes(differences)
         
-        # Create overall points summary sheet
-        self.create_points_summary_sheet(all_comparisons, all_rubric_stats)
+        # Most problematic first; a stable sort keeps ties in input order
+        order = np.argsort(-np.abs(differences), kind='stable')
+        
+        for index, difference, status_code in zip(order.tolist(), differences[order].tolist(), status_codes[order].tolist()):
+            yield stats[index], difference, status_code
     
     def create_submissions_points_sheet(self, comparisons: List[PointsComparison]):
         """Create sheet showing points comparison for each submission."""
         
         ws = self.wb.create_sheet("POINTS_BY_SUBMISSION")
         
-        # Define styles
-        header_fill = PatternFill(start_color="0F243E", end_color="0F243E", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        positive_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Green for AI higher
-        negative_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Red for AI lower
-        neutral_fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")  # Blue for same
+        # Adjust column widths (must happen before the first row is written)
+        column_widths = [15, 15, 12, 12, 15, 12, 15]
+        set_column_widths(ws, column_widths)
         
         # Headers
-        headers = ["CSV File", "Submission ID", "Human Total", "AI Total", "Difference (AI-Human)", "% Difference", "Status"]
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        
-        # Sort comparisons by absolute difference (largest discrepancies first)
-        sorted_comparisons = sorted(comparisons, key=lambda x: abs(x.difference), reverse=True)
+        ws.append(header_cells(
+            ws, self.SUBMISSION_POINTS_HEADERS, fill=POINTS_HEADER_FILL, border=None, alignment=CENTER_WRAP_ALIGNMENT
+        ))
         
         # Fill data
-        for row, comp in enumerate(sorted_comparisons, 2):
-            # Calculate percentage difference
-            if comp.human_total > 0:
-                pct_diff = (comp.difference / comp.human_total) * 100
-            else:
-                pct_diff = 0.0 if comp.ai_total == 0 else float('inf')
+        for comp, pct_diff, status_code in self._iter_submission_points(comparisons):
+            status, fill = POINTS_DIFFERENCE_STATUSES[status_code]
             
-            # Determine status and color
-            if abs(comp.difference) < 0.01:
-                status = "EXACT MATCH"
-                fill = neutral_fill
-            elif comp.difference > 0:
-                status = "AI HIGHER"
-                fill = positive_fill
+            # Fill row data, with the difference and status cells color coded
+            if pct_diff is not None:
+                pct_cell = make_cell(ws, pct_diff, fill=fill, number_format='0.0"%"')
             else:
-                status = "AI LOWER"
-                fill = negative_fill
-            
-            # Fill row data
-            ws.cell(row=row, column=1, value=getattr(comp, 'csv_name', 'Unknown'))
-            ws.cell(row=row, column=2, value=comp.submission_id)
-            ws.cell(row=row, column=3, value=comp.human_total).number_format = '0.0'
-            ws.cell(row=row, column=4, value=comp.ai_total).number_format = '0.0'
-            ws.cell(row=row, column=5, value=comp.difference).number_format = '0.0'
-            
-            pct_cell = ws.cell(row=row, column=6, value=pct_diff if pct_diff != float('inf') else 'N/A')
-            if pct_diff != float('inf'):
-                pct_cell.number_format = '0.0"%"'
-            
-            status_cell = ws.cell(row=row, column=7, value=status)
-            
-            # Apply formatting to difference and status cells
-            for col in [5, 6, 7]:
-                ws.cell(row=row, column=col).fill = fill
-        
-        # Adjust column widths
-        column_widths = [15, 15, 12, 12, 15, 12, 15]
-        for col, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(col)].width = width
+                pct_cell = make_cell(ws, 'N/A', fill=fill)
+            
+            ws.append([
+                comp.csv_name,
+                comp.submission_id,
+                make_cell(ws, comp.human_total, number_format='0.0'),
+                make_cell(ws, comp.ai_total, number_format='0.0'),
+                make_cell(ws, comp.difference, fill=fill, number_format='0.0'),
+                pct_cell,
+                make_cell(ws, status, fill=fill),
+            ])
     
     def create_rubric_points_analysis_sheet(self, stats: List[RubricItemStats]):
         """Create sheet showing points analysis for each rubric item."""
         
         ws = self.wb.create_sheet("RUBRIC_POINTS_ANALYSIS")
         
-        # Define styles
-        header_fill = PatternFill(start_color="0F243E", end_color="0F243E", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
+        # Adjust column widths (must happen before the first row is written)
+        column_widths = [15, 40, 10, 10, 10, 10, 12, 10, 10, 12, 10]
+        set_column_widths(ws, column_widths)
         
         # Headers
-        headers = [
-            "CSV File", "Rubric Item", "Type", "Max Points", 
-            "Human Avg", "AI Avg", "Difference", "Human Std", "AI Std",
-            "Agreement %", "Sample Size"
-        ]
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        
-        # Sort stats by absolute difference (most problematic first)
-        sorted_stats = sorted(stats, key=lambda x: abs(x.ai_avg - x.human_avg), reverse=True)
+        ws.append(header_cells(
+            ws, self.RUBRIC_POINTS_HEADERS, fill=POINTS_HEADER_FILL, border=None, alignment=CENTER_WRAP_ALIGNMENT
+        ))
         
         # Fill data
-        for row, stat in enumerate(sorted_stats, 2):
-            difference = stat.ai_avg - stat.human_avg
-            
-            ws.cell(row=row, column=1, value=getattr(stat, 'csv_name', 'Unknown'))
-            ws.cell(row=row, column=2, value=stat.description[:50] + "..." if len(stat.description) > 50 else stat.description)
-            ws.cell(row=row, column=3, value=stat.rubric_type)
-            ws.cell(row=row, column=4, value=stat.max_points).number_format = '0.0'
-            ws.cell(row=row, column=5, value=stat.human_avg).number_format = '0.00'
-            ws.cell(row=row, column=6, value=stat.ai_avg).number_format = '0.00'
-            ws.cell(row=row, column=7, value=difference).number_format = '0.00'
-            ws.cell(row=row, column=8, value=stat.human_std).number_format = '0.00'
-            ws.cell(row=row, column=9, value=stat.ai_std).number_format = '0.00'
-            ws.cell(row=row, column=10, value=stat.agreement_rate).number_format = '0.0"%"'
-            ws.cell(row=row, column=11, value=stat.sample_size)
-            
-            # Color code the difference column
-            diff_cell = ws.cell(row=row, column=7)
-            if abs(difference) < 0.01:
-                diff_cell.fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")  # Blue
-            elif difference > 0:
-                diff_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Green
-            else:
-                diff_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Red
-        
-        # Adjust column widths
-        column_widths = [15, 40, 10, 10, 10, 10, 12, 10, 10, 12, 10]
-        for col, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(col)].width = width
+        for stat, difference, status_code in self._iter_rubric_points(stats):
+            diff_fill = POINTS_DIFFERENCE_STATUSES[status_code][1]  # Color code the difference column
+            
+            ws.append([
+                stat.csv_name,
+                shorten(stat.description, 50),
+                stat.rubric_type,
+                make_cell(ws, stat.max_points, number_format='0.0'),
+                make_cell(ws, stat.human_avg, number_format='0.00'),
+                make_cell(ws, stat.ai_avg, number_format='0.00'),
+                make_cell(ws, difference, fill=diff_fill, number_format='0.00'),
+                make_cell(ws, stat.human_std, number_format='0.00'),
+                make_cell(ws, stat.ai_std, number_format='0.00'),
+                make_cell(ws, stat.agreement_rate, number_format='0.0"%"'),
+                stat.sample_size,
+            ])
     
     def create_points_summary_sheet(self, comparisons: List[PointsComparison], stats: List[RubricItemStats]):
         """Create sheet with overall points analysis summary."""
         
         ws = self.wb.create_sheet("POINTS_SUMMARY", 0)  # Make it the first sheet
         
+        # Adjust column widths (must happen before the first row is written)
+        set_column_widths(ws, [30, 25])
+        
         # Calculate overall statistics
         if not comparisons:
-            ws.cell(row=1, column=1, value="No points comparison data available")
+            ws.append(["No points comparison data available"])
             return
-            
-        human_totals = [c.human_total for c in comparisons]
-        ai_totals = [c.ai_total for c in comparisons]
-        differences = [c.difference for c in comparisons]
         
-        human_avg = statistics.mean(human_totals)
-        ai_avg = statistics.mean(ai_totals)
-        human_std = statistics.stdev(human_totals) if len(human_totals) > 1 else 0.0
-        ai_std = statistics.stdev(ai_totals) if len(ai_totals) > 1 else 0.0
+        # Each statistic is one NumPy reduction over the extracted columns
+        human_totals, ai_totals, differences = comparison_arrays(comparisons)
+        
+        human_avg, human_std = float(human_totals.mean()), sample_std(human_totals)
+        ai_avg, ai_std = float(ai_totals.mean()), sample_std(ai_totals)
         
-        avg_diff = statistics.mean(differences)
-        abs_avg_diff = statistics.mean([abs(d) for d in differences])
+        abs_differences = np.abs(differences)
+        avg_diff = float(differences.mean())
+        abs_avg_diff = float(abs_differences.mean())
         
         # Agreement statistics
-        exact_matches = sum(1 for c in comparisons if abs(c.difference) < 0.01)
-        close_matches = sum(1 for c in comparisons if abs(c.difference) <= 1.0)
+        exact_matches = int(np.count_nonzero(abs_differences < 0.01))
+        close_matches = int(np.count_nonzero(abs_differences <= 1.0))
         
-        # Write summary
-        row = 1
+        # Write summary, one appended row at a time
         
         # Title
-        title_cell = ws.cell(row=row, column=1, value="📊 POINTS ANALYSIS SUMMARY")
-        title_cell.font = Font(bold=True, size=16, color="0F243E")
-        row += 2
+        ws.append([make_cell(ws, "📊 POINTS ANALYSIS SUMMARY", font=POINTS_TITLE_FONT)])
+        ws.append([])
         
         # Basic statistics
-        ws.cell(row=row, column=1, value="OVERALL STATISTICS").font = Font(bold=True, size=12)
-        row += 1
+        ws.append([make_cell(ws, "OVERALL STATISTICS", font=SECTION_FONT)])
+        
+        total = len(comparisons)
         
         summary_data = [
-            ("Sample Size:", f"{len(comparisons)} submissions"),
+            ("Sample Size:", f"{total} submissions"),
             ("", ""),
             ("Human Average:", f"{human_avg:.2f} ± {human_std:.2f} points"),
             ("AI Average:", f"{ai_avg:.2f} ± {ai_std:.2f} points"),
@@ -1860,193 +2249,108 @@ class UnifiedExcelReportGenerator:
             ("Avg Absolute Difference:", f"{abs_avg_diff:.2f} points"),
             ("Percentage Difference:", f"{(avg_diff / human_avg * 100):.1f}%" if human_avg > 0 else "N/A"),
             ("", ""),
-            ("Exact Matches:", f"{exact_matches}/{len(comparisons)} ({exact_matches/len(comparisons)*100:.1f}%)"),
-            ("Close Matches (±1pt):", f"{close_matches}/{len(comparisons)} ({close_matches/len(comparisons)*100:.1f}%)"),
+            ("Exact Matches:", f"{exact_matches}/{total} ({exact_matches / total * 100:.1f}%)"),
+            ("Close Matches (±1pt):", f"{close_matches}/{total} ({close_matches / total * 100:.1f}%)"),
         ]
         
         for label, value in summary_data:
-            ws.cell(row=row, column=1, value=label).font = Font(bold=True if label and not label.startswith(" ") else False)
-            ws.cell(row=row, column=2, value=value)
-            row += 1
+            ws.append([make_cell(ws, label, font=BOLD_FONT if label and not label.startswith(" ") else NORMAL_FONT), value])
         
         # Rubric-level summary
         if stats:
-            row += 1
-            ws.cell(row=row, column=1, value="RUBRIC ITEM ANALYSIS").font = Font(bold=True, size=12)
-            row += 1
+            ws.append([])
+            ws.append([make_cell(ws, "RUBRIC ITEM ANALYSIS", font=SECTION_FONT)])
             
-            avg_agreement = statistics.mean([s.agreement_rate for s in stats])
-            ws.cell(row=row, column=1, value="Average Agreement Rate:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=f"{avg_agreement:.1f}%")
-            row += 2
+            avg_agreement = average([s.agreement_rate for s in stats])
+            ws.append([make_cell(ws, "Average Agreement Rate:", font=BOLD_FONT), f"{avg_agreement:.1f}%"])
+            ws.append([])
             
             # Most problematic rubric items
-            problematic = sorted(stats, key=lambda s: abs(s.ai_avg - s.human_avg), reverse=True)[:5]
-            ws.cell(row=row, column=1, value="MOST DIFFERENT RUBRIC ITEMS").font = Font(bold=True, size=11)
-            row += 1
+            problematic = heapq.nlargest(5, stats, key=lambda s: abs(s.ai_avg - s.human_avg))
+            ws.append([make_cell(ws, "MOST DIFFERENT RUBRIC ITEMS", font=SUBSECTION_FONT)])
             
             for i, stat in enumerate(problematic, 1):
                 diff = stat.ai_avg - stat.human_avg
-                desc = stat.description[:60] + "..." if len(stat.description) > 60 else stat.description
+                desc = shorten(stat.description, 60)
                 
-                ws.cell(row=row, column=1, value=f"{i}. {desc}").font = Font(bold=True)
-                row += 1
-                ws.cell(row=row, column=1, value=f"   Human: {stat.human_avg:.2f}, AI: {stat.ai_avg:.2f}, Diff: {diff:.2f}")
+                ws.append([make_cell(ws, f"{i}. {desc}", font=BOLD_FONT)])
                 
                 # Color code the difference
-                diff_cell = ws.cell(row=row, column=1)
                 if abs(diff) > 1.0:
-                    diff_cell.font = Font(color="C00000")  # Red for large differences
+                    diff_font = LARGE_DIFF_FONT  # Red for large differences
                 elif abs(diff) > 0.5:
-                    diff_cell.font = Font(color="FF8C00")  # Orange for medium differences
+                    diff_font = MEDIUM_DIFF_FONT  # Orange for medium differences
+                else:
+                    diff_font = None
                 
-                row += 1
+                ws.append([make_cell(ws, f"   Human: {stat.human_avg:.2f}, AI: {stat.ai_avg:.2f}, Diff: {diff:.2f}", font=diff_font)])
         
         # Distribution analysis
-        row += 1
-        ws.cell(row=row, column=1, value="DISTRIBUTION ANALYSIS").font = Font(bold=True, size=12)
-        row += 1
+        ws.append([])
+        ws.append([make_cell(ws, "DISTRIBUTION ANALYSIS", font=SECTION_FONT)])
         
         # Count submissions by difference ranges
-        large_pos = sum(1 for c in comparisons if c.difference >= 2.0)
-        small_pos = sum(1 for c in comparisons if 0.1 <= c.difference < 2.0)
-        exact = sum(1 for c in comparisons if abs(c.difference) < 0.1)
-        small_neg = sum(1 for c in comparisons if -2.0 < c.difference <= -0.1)
-        large_neg = sum(1 for c in comparisons if c.difference <= -2.0)
-        
-        distribution_data = [
-            ("AI Much Higher (≥2pts):", f"{large_pos} ({large_pos/len(comparisons)*100:.1f}%)"),
-            ("AI Slightly Higher:", f"{small_pos} ({small_pos/len(comparisons)*100:.1f}%)"),
-            ("Same Score (±0.1pts):", f"{exact} ({exact/len(comparisons)*100:.1f}%)"),
-            ("AI Slightly Lower:", f"{small_neg} ({small_neg/len(comparisons)*100:.1f}%)"),
-            ("AI Much Lower (≤-2pts):", f"{large_neg} ({large_neg/len(comparisons)*100:.1f}%)"),
+        large_pos = int(np.count_nonzero(differences >= 2.0))
+        small_pos = int(np.count_nonzero((differences >= 0.1) & (differences < 2.0)))
+        exact = int(np.count_nonzero(abs_differences < 0.1))
+        small_neg = int(np.count_nonzero((differences > -2.0) & (differences <= -0.1)))
+        large_neg = int(np.count_nonzero(differences <= -2.0))
+        
+        distribution_counts = [
+            ("AI Much Higher (≥2pts):", large_pos),
+            ("AI Slightly Higher:", small_pos),
+            ("Same Score (±0.1pts):", exact),
+            ("AI Slightly Lower:", small_neg),
+            ("AI Much Lower (≤-2pts):", large_neg),
         ]
         
-        for label, value in distribution_data:
-            ws.cell(row=row, column=1, value=label).font = Font(bold=True)
-            ws.cell(row=row, column=2, value=value)
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 25
+        for label, count in distribution_counts:
+            ws.append([make_cell(ws, label, font=BOLD_FONT), f"{count} ({count / total * 100:.1f}%)"])
     
-    def create_comprehensive_summary_sheet(self, all_evaluation_data: List[Dict]):
+    def create_comprehensive_summary_sheet(
+        self,
+        all_evaluation_data: List[Dict],
+        all_stats: Optional[List[Dict[str, Any]]] = None
+    ):
         """Create a comprehensive summary sheet combining all CSV evaluations."""
         
         summary_ws = self.wb.create_sheet("COMPREHENSIVE_SUMMARY")
         
-        # Calculate combined statistics
-        all_stats = []
+        # Calculate combined statistics unless they were tallied while writing the CSV sheets
+        if all_stats is None:
+            all_stats = self._collect_summary_stats(all_evaluation_data)
         
-        for eval_data in all_evaluation_data:
-            csv_name = eval_data['csv_name']
-            rubric_items = eval_data['rubric_items']
-            human_grades = eval_data['human_grades']
-            backend_results = eval_data['backend_results']
-            
-            for rubric_item in rubric_items:
-                total = 0
-                matches = 0
-                false_positives = 0
-                false_negatives = 0
-                no_data = 0
-                avg_confidence = 0
-                confidence_count = 0
-                
-                for submission_id, student_grade in human_grades.items():
-                    total += 1
-                    human_value = student_grade.grades.get(rubric_item.id, False)
-                    
-                    backend_results_student = backend_results.get(submission_id, [])
-                    backend_result = next((r for r in backend_results_student if r.rubric_id == rubric_item.id), None)
-                    
-                    if backend_result:
-                        avg_confidence += backend_result.confidence
-                        confidence_count += 1
-                        
-                        if rubric_item.type == "CHECKBOX":
-                            human_bool = human_value
-                            backend_bool = backend_result.decision == "check"
-                            
-                            if human_bool == backend_bool:
-                                matches += 1
-                            elif human_bool and not backend_bool:
-                                false_negatives += 1
-                            else:
-                                false_positives += 1
-                        else:  # RADIO
-                            # For radio buttons, compare letters
-                            if str(human_value) == backend_result.decision:
-                                matches += 1
-                            else:
-                                false_positives += 1  # Treat all mismatches as false positives for radio
-                    else:
-                        no_data += 1
-                
-                if confidence_count > 0:
-                    avg_confidence /= confidence_count
-                
-                all_stats.append({
-                    'csv_name': csv_name,
-                    'rubric': rubric_item.description,
-                    'type': rubric_item.type,
-                    'total': total,
-                    'matches': matches,
-                    'false_positives': false_positives,
-                    'false_negatives': false_negatives,
-                    'no_data': no_data,
-                    'accuracy': matches / (total - no_data) if (total - no_data) > 0 else 0,
-                    'avg_confidence': avg_confidence
-                })
+        # Calculate overall project stats as column sums gathered in a single pass over all rubrics
+        columns = np.array(
+            [(stat['total'], stat['matches'], stat['false_positives'], stat['false_negatives'], stat['no_data'],
+              stat['avg_confidence'] * stat['total'])
+             for stat in all_stats],
+            dtype=np.float64
+        ).reshape(-1, 6).sum(axis=0)
+        
+        total_evaluations, total_matches, total_false_positives, total_false_negatives, total_no_data = (
+            int(total) for total in columns[:5]
+        )
+        
+        graded = total_evaluations - total_no_data
+        overall_accuracy = total_matches / graded if graded > 0 else 0
+        overall_confidence = float(columns[5]) / total_evaluations if total_evaluations > 0 else 0
+        
+        # Adjust column widths for summary (must happen before the first row is written)
+        set_column_widths(summary_ws, [20] * len(self.SUMMARY_HEADERS))
+        
+        # Write project overview at the top, followed by an empty row
+        summary_ws.append([make_cell(summary_ws, "PROJECT OVERVIEW", font=OVERVIEW_FONT)])
+        summary_ws.append([f"Total Evaluations: {total_evaluations}", None, f"Overall Accuracy: {overall_accuracy * 100:.1f}%"])
+        summary_ws.append([f"Total Matches: {total_matches}", None, f"Overall Confidence: {overall_confidence * 100:.1f}%"])
+        summary_ws.append([f"False Positives: {total_false_positives}", None, f"False Negatives: {total_false_negatives}"])
+        summary_ws.append([])
         
         # Write comprehensive summary
-        headers = ["CSV File", "Rubric Item", "Type", "Total", "Matches", "False Positives", 
-                   "False Negatives", "No Data", "Accuracy %", "Avg Confidence %"]
-        
-        for col, header in enumerate(headers, 1):
-            cell = summary_ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
-        
-        for row, stat in enumerate(all_stats, 2):
-            summary_ws.cell(row=row, column=1, value=stat['csv_name'])
-            summary_ws.cell(row=row, column=2, value=stat['rubric'])
-            summary_ws.cell(row=row, column=3, value=stat['type'])
-            summary_ws.cell(row=row, column=4, value=stat['total'])
-            summary_ws.cell(row=row, column=5, value=stat['matches'])
-            summary_ws.cell(row=row, column=6, value=stat['false_positives'])
-            summary_ws.cell(row=row, column=7, value=stat['false_negatives'])
-            summary_ws.cell(row=row, column=8, value=stat['no_data'])
-            summary_ws.cell(row=row, column=9, value=f"{stat['accuracy'] * 100:.1f}")
-            summary_ws.cell(row=row, column=10, value=f"{stat['avg_confidence'] * 100:.1f}")
-        
-        # Adjust column widths for summary
-        for col in range(1, 11):
-            summary_ws.column_dimensions[get_column_letter(col)].width = 20
-        
-        # Add overall project statistics at the top after some empty rows
-        summary_ws.insert_rows(1, 5)
-        
-        # Calculate overall project stats
-        total_evaluations = sum(stat['total'] for stat in all_stats)
-        total_matches = sum(stat['matches'] for stat in all_stats)
-        total_false_positives = sum(stat['false_positives'] for stat in all_stats)
-        total_false_negatives = sum(stat['false_negatives'] for stat in all_stats)
-        total_no_data = sum(stat['no_data'] for stat in all_stats)
-        
-        overall_accuracy = total_matches / (total_evaluations - total_no_data) if (total_evaluations - total_no_data) > 0 else 0
-        overall_confidence = sum(stat['avg_confidence'] * stat['total'] for stat in all_stats) / total_evaluations if total_evaluations > 0 else 0
-        
-        # Write project overview
-        summary_ws.cell(row=1, column=1, value="PROJECT OVERVIEW").font = Font(bold=True, size=14)
-        summary_ws.cell(row=2, column=1, value=f"Total Evaluations: {total_evaluations}")
-        summary_ws.cell(row=2, column=3, value=f"Overall Accuracy: {overall_accuracy * 100:.1f}%")
-        summary_ws.cell(row=3, column=1, value=f"Total Matches: {total_matches}")
-        summary_ws.cell(row=3, column=3, value=f"Overall Confidence: {overall_confidence * 100:.1f}%")
-        summary_ws.cell(row=4, column=1, value=f"False Positives: {total_false_positives}")
-        summary_ws.cell(row=4, column=3, value=f"False Negatives: {total_false_negatives}")
+        summary_ws.append([make_cell(summary_ws, header, font=HEADER_FONT, fill=HEADER_FILL) for header in self.SUMMARY_HEADERS])
+        
+        for row in self._iter_summary_rows(all_stats):
+            summary_ws.append(row)
 
 
 class PointsReporter:
@@ -2061,10 +2365,8 @@ class PointsReporter:
         print(f"{'Submission ID':<15} {'Human Total':<12} {'AI Total':<12} {'Difference':<12} {'% Diff':<12}")
         print("-" * 80)
         
-        # Sort by absolute difference (largest discrepancies first)
-        sorted_comparisons = sorted(comparisons, key=lambda x: abs(x.difference), reverse=True)
-        
-        for i, comp in enumerate(sorted_comparisons[:limit]):
+        # Largest discrepancies first; only the top `limit` are printed
+        for comp in heapq.nlargest(limit, comparisons, key=lambda x: abs(x.difference)):
             if comp.human_total > 0:
                 pct_diff = (comp.difference / comp.human_total) * 100
             else:
@@ -2073,8 +2375,8 @@ class PointsReporter:
             print(f"{comp.submission_id:<15} {comp.human_total:<12.1f} {comp.ai_total:<12.1f} "
                   f"{comp.difference:<12.1f} {pct_diff:<12.1f}%")
         
-        if len(sorted_comparisons) > limit:
-            print(f"... and {len(sorted_comparisons) - limit} more submissions")
+        if len(comparisons) > limit:
+            print(f"... and {len(comparisons) - limit} more submissions")
     
     @staticmethod
     def print_rubric_stats(stats: List[RubricItemStats]) -> None:
@@ -2088,7 +2390,7 @@ class PointsReporter:
         
         for stat in stats:
             diff = stat.ai_avg - stat.human_avg
-            description = stat.description[:37] + "..." if len(stat.description) > 40 else stat.description
+            description = shorten(stat.description, 40, keep=37)
             
             print(f"{description:<40} {stat.rubric_type:<10} {stat.max_points:<8.1f} "
                   f"{stat.human_avg:<10.2f} {stat.ai_avg:<10.2f} {diff:<8.2f} "
@@ -2106,19 +2408,17 @@ class PointsReporter:
         print(f"{'='*60}")
         
         # Calculate overall statistics
-        human_totals = [c.human_total for c in comparisons]
-        ai_totals = [c.ai_total for c in comparisons]
-        differences = [c.difference for c in comparisons]
+        total = len(comparisons)
+        human_totals, ai_totals, differences = comparison_arrays(comparisons)
+        abs_differences = np.abs(differences)
         
-        human_avg = statistics.mean(human_totals)
-        ai_avg = statistics.mean(ai_totals)
-        human_std = statistics.stdev(human_totals) if len(human_totals) > 1 else 0.0
-        ai_std = statistics.stdev(ai_totals) if len(ai_totals) > 1 else 0.0
+        human_avg, human_std = float(human_totals.mean()), sample_std(human_totals)
+        ai_avg, ai_std = float(ai_totals.mean()), sample_std(ai_totals)
         
-        avg_diff = statistics.mean(differences)
-        abs_avg_diff = statistics.mean([abs(d) for d in differences])
+        avg_diff = float(differences.mean())
+        abs_avg_diff = float(abs_differences.mean())
         
-        print(f"Sample Size: {len(comparisons)} submissions")
+        print(f"Sample Size: {total} submissions")
         print(f"")
         print(f"TOTAL POINTS COMPARISON:")
         print(f"  Human Average:     {human_avg:.2f} ± {human_std:.2f}")
@@ -2131,37 +2431,186 @@ class PointsReporter:
             print(f"  Percentage Diff:    {pct_diff:.1f}%")
         
         # Agreement statistics
-        exact_matches = sum(1 for c in comparisons if abs(c.difference) < 0.01)
-        close_matches = sum(1 for c in comparisons if abs(c.difference) <= 1.0)
+        exact_matches = int(np.count_nonzero(abs_differences < 0.01))
+        close_matches = int(np.count_nonzero(abs_differences <= 1.0))
         
         print(f"")
         print(f"AGREEMENT ANALYSIS:")
-        print(f"  Exact Matches:      {exact_matches}/{len(comparisons)} ({exact_matches/len(comparisons)*100:.1f}%)")
-        print(f"  Close Matches (±1): {close_matches}/{len(comparisons)} ({close_matches/len(comparisons)*100:.1f}%)")
+        print(f"  Exact Matches:      {exact_matches}/{total} ({exact_matches/total*100:.1f}%)")
+        print(f"  Close Matches (±1): {close_matches}/{total} ({close_matches/total*100:.1f}%)")
         
         # Rubric-level summary
         if stats:
-            avg_agreement = statistics.mean([s.agreement_rate for s in stats])
+            avg_agreement = average([s.agreement_rate for s in stats])
             print(f"  Avg Rubric Agreement: {avg_agreement:.1f}%")
             
             # Identify most problematic rubric items
-            problematic = sorted(stats, key=lambda s: abs(s.ai_avg - s.human_avg), reverse=True)[:3]
+            problematic = heapq.nlargest(3, stats, key=lambda s: abs(s.ai_avg - s.human_avg))
             print(f"")
             print(f"MOST DIFFERENT RUBRIC ITEMS:")
             for i, stat in enumerate(problematic, 1):
                 diff = stat.ai_avg - stat.human_avg
-                desc = stat.description[:50] + "..." if len(stat.description) > 50 else stat.description
+                desc = shorten(stat.description, 50)
                 print(f"  {i}. {desc}")
                 print(f"     Human: {stat.human_avg:.2f}, AI: {stat.ai_avg:.2f}, Diff: {diff:.2f}")
 
 
+def parse_rubric_cached(
+    csv_file: Path,
+    cache_dir: Optional[Path] = None
+) -> Tuple[List[RubricItem], Dict[str, StudentGrade]]:
+    """Parse a grades CSV, reusing the pickled result while the file is unchanged."""
+    if cache_dir is None:
+        return CSVParser.parse_rubric_from_csv(csv_file)
+    
+    stat = csv_file.stat()
+    cache_key = (RUBRIC_CACHE_VERSION, str(csv_file.resolve()), stat.st_mtime_ns, stat.st_size)
+    cache_path = cache_dir / f"{hashlib.sha1(repr(cache_key[:2]).encode()).hexdigest()}.pkl"
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, parsed = pickle.load(f)
+        if cached_key == cache_key:
+            return parsed
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Ignoring unreadable rubric cache %s: %s", cache_path, e)
+    
+    parsed = CSVParser.parse_rubric_from_csv(csv_file)
+    
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((cache_key, parsed), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write rubric cache %s: %s", cache_path, e)
+    
+    return parsed
+
+
+def submission_fingerprint(
+    assignment_context: Dict[str, str],
+    source_files: Dict[str, str],
+    rubric_items: List[Dict[str, Any]]
+) -> str:
+    """Hash everything sent to the backend for one student into a short cache key."""
+    fp = hashlib.blake2b(digest_size=16)
+    fp.update(json.dumps(assignment_context, sort_keys=True).encode())
+    for path in sorted(source_files):
+        fp.update(path.encode())
+        fp.update(b"\0")
+        fp.update(source_files[path].encode())
+        fp.update(b"\0")
+    fp.update(json.dumps(rubric_items, sort_keys=True).encode())
+    return fp.hexdigest()
+
+
+def load_cached_results(cache_path: Path) -> Optional[List[EvaluationResult]]:
+    """Load backend results stored by store_cached_results, or None on a miss."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            results = [EvaluationResult(**entry) for entry in json.load(f)]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable result cache %s: %s", cache_path, e)
+        return None
+    for result in results:
+        result.rubric_id = intern_text(result.rubric_id)
+        result.decision = intern_text(result.decision)
+    return results
+
+
+def store_cached_results(cache_path: Path, results: List[EvaluationResult]) -> None:
+    """Persist a student's backend results as JSON next to the other caches."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([asdict(result) for result in results], f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write result cache %s: %s", cache_path, e)
+
+
+def walk_submission_files(root: Path):
+    """Yield (relative_path, full_path) for every file under root using os.scandir."""
+    pending = [(os.fspath(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relative_path = os.path.join(prefix, entry.name) if prefix else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, relative_path))
+                elif entry.is_file():
+                    yield relative_path, entry.path
+
+
+def load_submission_files(submission_dir: Path) -> Dict[str, str]:
+    """Read and filter a submission's source files (same logic as Chrome extension)."""
+    source_files = {}
+    for relative_path, full_path in walk_submission_files(submission_dir):
+        try:
+            data = Path(full_path).read_bytes()
+        except Exception as e:
+            print(f"      Error reading {full_path}: {e}")
+            continue
+        
+        # Apply same filtering logic as Chrome extension, decoding only files that are kept
+        processed_content = CSVParser.process_file_bytes(relative_path, data)
+        if processed_content is not None:  # None means file was filtered out
+            source_files[relative_path] = processed_content
+    return source_files
+
+
+def drop_empty_evaluations(all_evaluation_data: List[Dict]) -> List[Dict]:
+    """Keep only CSV evaluations that would produce at least one report row."""
+    return [
+        eval_data for eval_data in all_evaluation_data
+        if eval_data['rubric_items'] and eval_data['human_grades']
+    ]
+
+
+def write_unified_report(
+    project_name: str,
+    all_evaluation_data: List[Dict],
+    output_dir: Path,
+    report_format: str = "xlsx"
+) -> Path:
+    """Write a project's unified report as a styled workbook or as plain CSV files."""
+    generator = UnifiedExcelReportGenerator()
+    output_path = output_dir / f"{project_name}_UNIFIED_evaluation.xlsx"
+    
+    if report_format == "csv":
+        return generator.create_unified_csv_report(project_name, all_evaluation_data, output_path)
+    
+    generator.create_unified_report(
+        project_name=project_name,
+        all_evaluation_data=all_evaluation_data,
+        output_path=output_path
+    )
+    return output_path
+
+
 async def evaluate_project(
     project_path: Path,
     backend_client: BackendClient,
     num_students: int,
-    output_dir: Path
+    output_dir: Path,
+    concurrency: int = DEFAULT_CONCURRENT_BATCH_SIZE,
+    report_format: str = "xlsx",
+    use_cache: bool = True,
+    reuse_results: bool = False,
+    request_semaphore: Optional[asyncio.Semaphore] = None
 ) -> None:
-    """Evaluate a single project."""
+    """Evaluate a single project, grading up to `concurrency` students at once.
+    
+    Pass `request_semaphore` to share the in-flight limit with other projects instead.
+    """
     
     print(f"\nEvaluating project: {project_path.name}")
     
@@ -2178,6 +2627,9 @@ async def evaluate_project(
         print(f"No CSV files found in {grades_dir}")
         return
     
+    rubric_cache_dir = output_dir / RUBRIC_CACHE_DIRNAME if use_cache else None
+    result_cache_dir = output_dir / RESULT_CACHE_DIRNAME if reuse_results else None
+    
     # Collect all evaluation data for unified report
     all_evaluation_data = []
     
@@ -2186,13 +2638,15 @@ async def evaluate_project(
         print(f"  Processing {csv_file.name}")
         
         # Parse CSV
-        parser = CSVParser()
-        rubric_items, human_grades = parser.parse_rubric_from_csv(csv_file)
+        rubric_items, human_grades = parse_rubric_cached(csv_file, rubric_cache_dir)
         # Pre-filter bonus-point and zero-point items so all subsequent logic
         # (backend calls, statistics, Excel reports) uses the same cleaned list.
         filtered_rubric_items = filter_rubric_items_for_backend(rubric_items)
 
         print(f"    Found {len(filtered_rubric_items)} rubric items after filtering and {len(human_grades)} students")
+        if not filtered_rubric_items or not human_grades:
+            print(f"    Skipping {csv_file.stem}: nothing to evaluate")
+            continue
         
         # Select students to evaluate (randomly sampled)
         all_student_ids = list(human_grades.keys())
@@ -2203,78 +2657,82 @@ async def evaluate_project(
             student_ids = random.sample(all_student_ids, num_students)
             print(f"    Randomly selected {len(student_ids)} students from {len(all_student_ids)} available")
         
-        # Collect backend results
-        backend_results = {}
+        # Prepare rubric items for backend once per CSV; they are the same for every student
+        backend_rubric_items = build_backend_rubric_items(filtered_rubric_items)
         
-        for idx, student_id in enumerate(student_ids):
-            print(f"    Evaluating student {idx + 1}/{len(student_ids)}: {student_id}")
-            
-            # Load student files
+        context_template = {
+            "course_id": project_path.name,
+            "assignment_id": project_path.name,  # Use project directory name for rubric mapping
+            "assignment_name": f"{project_path.name} - {csv_file.stem}"
+        }
+        
+        # Locate submissions, then read and filter their source files in worker threads at once
+        submission_dirs = {}
+        for student_id in student_ids:
             submission_dir = assignments_dir / f"submission_{student_id}"
             if not submission_dir.exists():
                 print(f"      Submission directory not found: {submission_dir}")
                 continue
-            
-            # Read and filter source files (same logic as Chrome extension)
-            source_files = {}
-            for file_path in submission_dir.rglob("*"):
-                if file_path.is_file():
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            relative_path = file_path.relative_to(submission_dir)
-                            content = f.read()
-                            
-                            # Apply same filtering logic as Chrome extension
-                            processed_content = CSVParser.process_file_content(str(relative_path), content)
-                            if processed_content is not None:  # None means file was filtered out
-                                source_files[str(relative_path)] = processed_content
-                    except Exception as e:
-                        print(f"      Error reading {file_path}: {e}")
-            
+            submission_dirs[student_id] = submission_dir
+        loaded_files = await asyncio.gather(
+            *(asyncio.to_thread(load_submission_files, submission_dir) for submission_dir in submission_dirs.values())
+        )
+        
+        tasks = []
+        for student_id, source_files in zip(submission_dirs, loaded_files):
             if not source_files:
                 print(f"      No source files found for {student_id}")
                 continue
-            
-            # Filter and prepare rubric items for backend
-            filtered_rubric_items = filter_rubric_items_for_backend(rubric_items)
-            backend_rubric_items = []
-            for rubric_item in filtered_rubric_items:
-                item_dict = {
-                    "id": rubric_item.id,
-                    "description": rubric_item.description,
-                    "points": rubric_item.points,
-                    "type": rubric_item.type
-                }
-                if rubric_item.options:
-                    # Convert letter-based options to backend format
-                    if rubric_item.type == "RADIO":
-                        # Options are in format: {"Q": {"text": "...", "points": "..."}, "W": {...}}
-                        # Backend expects: {"Q": "option text with credit indicator", "W": "option text with credit indicator"}
-                        item_dict["options"] = add_credit_indicators_to_radio_options(rubric_item.options)
-                    else:
-                        item_dict["options"] = rubric_item.options
-                backend_rubric_items.append(item_dict)
-            
-            # Send to backend
-            assignment_context = {
-                "course_id": project_path.name,
-                "assignment_id": project_path.name,  # Use project directory name for rubric mapping
-                "submission_id": student_id,
-                "assignment_name": f"{project_path.name} - {csv_file.stem}"
-            }
-            
-            # Print radio button JSON for debugging
-            print_radio_button_json(backend_rubric_items, f"Student {student_id}: ")
-            
-            try:
-                results = await backend_client.grade_submission(
-                    assignment_context=assignment_context,
-                    source_files=source_files,
-                    rubric_items=backend_rubric_items
-                )
-                backend_results[student_id] = results
-            except Exception as e:
-                print(f"      Error from backend: {e}")
+            tasks.append(EvaluationTask(
+                project_name=project_path.name,
+                csv_name=csv_file.stem,
+                student_id=student_id,
+                # Only the submission ID differs between students
+                assignment_context={**context_template, "submission_id": student_id},
+                source_files=source_files,
+                rubric_items=backend_rubric_items,
+                human_grade=human_grades[student_id],
+                rubric_items_list=filtered_rubric_items
+            ))
+        
+        # Reuse stored results when nothing sent to the backend has changed
+        student_results = {}
+        cache_paths = {}
+        if result_cache_dir is not None:
+            for task in tasks:
+                fingerprint = submission_fingerprint(task.assignment_context, task.source_files, backend_rubric_items)
+                cache_paths[task.student_id] = result_cache_dir / f"{task.student_id}_{fingerprint}.json"
+            cached = await asyncio.gather(
+                *(asyncio.to_thread(load_cached_results, cache_paths[task.student_id]) for task in tasks)
+            )
+            uncached_tasks = []
+            for task, cached_results in zip(tasks, cached):
+                if cached_results is None:
+                    uncached_tasks.append(task)
+                else:
+                    print(f"      Reusing cached results for {task.student_id}")
+                    student_results[task.student_id] = cached_results
+            tasks = uncached_tasks
+        
+        # Print radio button JSON for debugging
+        for task in tasks:
+            print_radio_button_json(backend_rubric_items, f"Student {task.student_id}: ")
+        
+        # Collect backend results, with at most `concurrency` (or the shared `request_semaphore`) students in flight
+        print(f"    Evaluating {len(tasks)} students")
+        for task, results in zip(tasks, await backend_client.grade_batch(tasks, concurrency, request_semaphore)):
+            if results is None:
+                continue
+            student_results[task.student_id] = results
+            # Only cache graded submissions; failed requests come back empty
+            cache_path = cache_paths.get(task.student_id)
+            if cache_path is not None and results:
+                await asyncio.to_thread(store_cached_results, cache_path, results)
+        backend_results = {
+            student_id: student_results[student_id]
+            for student_id in student_ids
+            if student_id in student_results
+        }
         
         # Filter human grades to only include evaluated students
         evaluated_human_grades = {sid: human_grades[sid] for sid in student_ids if sid in human_grades}
@@ -2291,15 +2749,12 @@ async def evaluate_project(
         print(f"    Completed evaluation for {csv_file.stem}")
     
     # Generate unified report for the entire project
+    all_evaluation_data = drop_empty_evaluations(all_evaluation_data)
     if all_evaluation_data:
         print(f"  Creating unified report for {project_path.name}")
-        unified_report_generator = UnifiedExcelReportGenerator()
-        unified_output_path = output_dir / f"{project_path.name}_UNIFIED_evaluation.xlsx"
-        
-        unified_report_generator.create_unified_report(
-            project_name=project_path.name,
-            all_evaluation_data=all_evaluation_data,
-            output_path=unified_output_path
+        # Write the report off the event loop so other projects keep grading meanwhile
+        unified_output_path = await asyncio.to_thread(
+            write_unified_report, project_path.name, all_evaluation_data, output_dir, report_format
         )
         
         print(f"  ✅ Unified report saved to: {unified_output_path}")
@@ -2309,9 +2764,15 @@ async def evaluate_project_with_points_analysis(
     project_path: Path,
     backend_client: BackendClient,
     num_students: int,
-    output_dir: Path
+    output_dir: Path,
+    use_cache: bool = True,
+    concurrency: int = DEFAULT_CONCURRENT_BATCH_SIZE,
+    request_semaphore: Optional[asyncio.Semaphore] = None
 ) -> None:
-    """Evaluate a project with comprehensive points analysis."""
+    """Evaluate a project with comprehensive points analysis, grading up to `concurrency` students at once.
+    
+    Pass `request_semaphore` to share the in-flight limit with other projects instead.
+    """
     
     print(f"\nEvaluating project with points analysis: {project_path.name}")
     
@@ -2328,6 +2789,8 @@ async def evaluate_project_with_points_analysis(
         print(f"No CSV files found in {grades_dir}")
         return
     
+    rubric_cache_dir = output_dir / RUBRIC_CACHE_DIRNAME if use_cache else None
+    
     # Collect all evaluation data
     all_comparisons = []
     all_stats = []
@@ -2337,8 +2800,7 @@ async def evaluate_project_with_points_analysis(
         print(f"  Processing {csv_file.name}")
         
         # Parse CSV
-        parser = CSVParser()
-        rubric_items, human_grades = parser.parse_rubric_from_csv(csv_file)
+        rubric_items, human_grades = parse_rubric_cached(csv_file, rubric_cache_dir)
         # Apply same rubric filtering used elsewhere so bonus / zero-point items
         # never appear in points-analysis statistics.
         filtered_rubric_items = filter_rubric_items_for_backend(rubric_items)
@@ -2352,92 +2814,55 @@ async def evaluate_project_with_points_analysis(
         else:
             student_ids = random.sample(all_student_ids, num_students)
         
-        # Collect AI grading results
-        ai_results = {}
+        # Prepare rubric items for backend once per CSV; they are the same for every student
+        backend_rubric_items = build_backend_rubric_items(filtered_rubric_items)
+        rubric_types = rubric_types_by_id(filtered_rubric_items)
         
+        # Locate submissions, then read and filter their source files in worker threads at once
+        submission_dirs = {}
         for student_id in student_ids:
-            human_grade = human_grades[student_id]
-            print(f"      Grading submission {student_id} ({human_grade.name})")
-            
-            # Load submission files
-            student_dir = assignments_dir / student_id
+            student_dir = assignments_dir / f"submission_{student_id}"
             if not student_dir.exists():
                 print(f"        ⚠️  Directory not found: {student_dir}")
                 continue
-            
-            source_files = {}
-            for file_path in student_dir.rglob("*"):
-                if file_path.is_file():
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            # Process file content with same logic as Chrome extension
-                            processed_content = parser.process_file_content(str(file_path.relative_to(student_dir)), content)
-                            if processed_content is not None:
-                                source_files[str(file_path.relative_to(student_dir))] = processed_content
-                    except Exception as e:
-                        print(f"        ⚠️  Error reading {file_path}: {e}")
-            
+            submission_dirs[student_id] = student_dir
+        loaded_files = await asyncio.gather(
+            *(asyncio.to_thread(load_submission_files, student_dir) for student_dir in submission_dirs.values())
+        )
+        
+        tasks = []
+        for student_id, source_files in zip(submission_dirs, loaded_files):
             if not source_files:
-                print(f"        ⚠️  No valid source files found")
+                print(f"        ⚠️  No valid source files found for {student_id}")
                 continue
-            
-                        # Get AI grading
-            try:
-                # Filter and convert rubric items to format expected by backend client
-                filtered_rubric_items = filter_rubric_items_for_backend(rubric_items)
-                backend_rubric_items = []
-                for item in filtered_rubric_items:
-                    backend_item = {
-                        "id": item.id,
-                        "description": item.description,
-                        "points": item.points,
-                        "type": item.type.upper()
-                    }
-                    if item.options:
-                        if str(item.type).upper() == "RADIO":
-                            backend_item["options"] = add_credit_indicators_to_radio_options(item.options)
-                        else:
-                            backend_item["options"] = item.options
-                    backend_rubric_items.append(backend_item)
-                
-                # Print radio button JSON for debugging
-                print_radio_button_json(backend_rubric_items, f"Points Analysis - Student {student_id}: ")
-                
-                # Call backend client
-                results = await backend_client.grade_submission(
-                    assignment_context={
-                        "course_id": project_path.name,
-                        "assignment_id": project_path.name,  # Use project directory name for rubric mapping
-                        "submission_id": student_id,
-                        "assignment_name": f"{project_path.name} - {csv_file.stem}"
-                    },
-                    source_files=source_files,
-                    rubric_items=backend_rubric_items
-                )
-                
-                # Convert results to decisions format
-                ai_decisions = {}
-                for result in results:
-                    # Create a mock decision object that matches expected structure
-                    decision = type('obj', (object,), {
-                        'verdict': type('obj', (object,), {
-                            'decision': type('obj', (object,), {'value': 'CHECK' if result.decision else 'CROSS'})() if result.rubric_id.startswith('checkbox') else None,
-                            'selected_option': result.decision if result.rubric_id.startswith('radio') else None
-                        })()
-                    })()
-                    ai_decisions[result.rubric_id] = decision
-                
-                ai_results[student_id] = AIGradingResult(
-                    submission_id=student_id,
-                    decisions=ai_decisions
-                )
-                
-                print(f"        ✅ AI grading completed ({len(ai_decisions)} decisions)")
-                
-            except Exception as e:
-                print(f"        ❌ AI grading failed: {e}")
+            print(f"      Grading submission {student_id} ({human_grades[student_id].name})")
+            # Print radio button JSON for debugging
+            print_radio_button_json(backend_rubric_items, f"Points Analysis - Student {student_id}: ")
+            tasks.append(EvaluationTask(
+                project_name=project_path.name,
+                csv_name=csv_file.stem,
+                student_id=student_id,
+                assignment_context={
+                    "course_id": project_path.name,
+                    "assignment_id": project_path.name,  # Use project directory name for rubric mapping
+                    "submission_id": student_id,
+                    "assignment_name": f"{project_path.name} - {csv_file.stem}"
+                },
+                source_files=source_files,
+                rubric_items=backend_rubric_items,
+                human_grade=human_grades[student_id],
+                rubric_items_list=filtered_rubric_items
+            ))
+        
+        # Collect AI grading results, with at most `concurrency` (or the shared `request_semaphore`) students in flight
+        ai_results = {}
+        for task, results in zip(tasks, await backend_client.grade_batch(tasks, concurrency, request_semaphore)):
+            if results is None:
                 continue
+            # Convert results to decisions format
+            ai_result = ai_grading_result(task.student_id, results, rubric_types)
+            print(f"        ✅ AI grading of {task.student_id} completed ({len(ai_result.decisions)} decisions)")
+            ai_results[task.student_id] = ai_result
         
         # Calculate points comparison for this CSV
         if ai_results:
@@ -2463,9 +2888,7 @@ async def evaluate_project_with_points_analysis(
         # Combine stats by rubric ID (averaging across CSV files)
         combined_stats = {}
         for stat in all_stats:
-            if stat.rubric_id not in combined_stats:
-                combined_stats[stat.rubric_id] = []
-            combined_stats[stat.rubric_id].append(stat)
+            combined_stats.setdefault(stat.rubric_id, []).append(stat)
         
         # Average the stats
         final_stats = []
@@ -2476,12 +2899,12 @@ async def evaluate_project_with_points_analysis(
                     description=stat_list[0].description,
                     rubric_type=stat_list[0].rubric_type,
                     max_points=stat_list[0].max_points,
-                    human_avg=statistics.mean([s.human_avg for s in stat_list]),
-                    ai_avg=statistics.mean([s.ai_avg for s in stat_list]),
-                    human_std=statistics.mean([s.human_std for s in stat_list]),
-                    ai_std=statistics.mean([s.ai_std for s in stat_list]),
-                    agreement_rate=statistics.mean([s.agreement_rate for s in stat_list]),
-                    sample_size=sum([s.sample_size for s in stat_list])
+                    human_avg=average([s.human_avg for s in stat_list]),
+                    ai_avg=average([s.ai_avg for s in stat_list]),
+                    human_std=average([s.human_std for s in stat_list]),
+                    ai_std=average([s.ai_std for s in stat_list]),
+                    agreement_rate=average([s.agreement_rate for s in stat_list]),
+                    sample_size=sum(s.sample_size for s in stat_list)
                 )
                 final_stats.append(avg_stat)
         
@@ -2492,11 +2915,11 @@ async def evaluate_project_with_points_analysis(
 
 async def collect_evaluation_tasks(
     projects_dir: Path,
-    num_students: int
+    num_students: int,
+    rubric_cache_dir: Optional[Path] = None
 ) -> List[EvaluationTask]:
     """Collect all evaluation tasks from all projects and assignments."""
     tasks = []
-    parser = CSVParser()
     
     project_dirs = [d for d in projects_dir.iterdir() if d.is_dir()]
     print(f"🔍 Collecting evaluation tasks from {len(project_dirs)} projects...")
@@ -2518,7 +2941,7 @@ async def collect_evaluation_tasks(
         
         for csv_file in csv_files:
             # Parse CSV
-            rubric_items, human_grades = parser.parse_rubric_from_csv(csv_file)
+            rubric_items, human_grades = parse_rubric_cached(csv_file, rubric_cache_dir)
             
             # Select students to evaluate
             all_student_ids = list(human_grades.keys())
@@ -2529,48 +2952,29 @@ async def collect_evaluation_tasks(
             
             print(f"    📄 {csv_file.name}: {len(student_ids)} students selected from {len(all_student_ids)} available")
             
+            # Filter and prepare rubric items for backend once; every task of this CSV shares them
+            filtered_rubric_items = filter_rubric_items_for_backend(rubric_items)
+            backend_rubric_items = build_backend_rubric_items(filtered_rubric_items)
+            
+            # Locate student submissions
+            submission_dirs = {}
             for student_id in student_ids:
-                # Load student files
                 submission_dir = assignments_dir / f"submission_{student_id}"
                 if not submission_dir.exists():
                     print(f"      ⚠️  Directory not found: {submission_dir}")
                     continue
-                
-                # Read and filter source files
-                source_files = {}
-                for file_path in submission_dir.rglob("*"):
-                    if file_path.is_file():
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                relative_path = file_path.relative_to(submission_dir)
-                                content = f.read()
-                                processed_content = CSVParser.process_file_content(str(relative_path), content)
-                                if processed_content is not None:
-                                    source_files[str(relative_path)] = processed_content
-                        except Exception as e:
-                            print(f"      ⚠️  Error reading {file_path}: {e}")
-                
+                submission_dirs[student_id] = submission_dir
+            
+            # Read and filter every submission's source files in worker threads at once
+            loaded_files = await asyncio.gather(
+                *(asyncio.to_thread(load_submission_files, submission_dir) for submission_dir in submission_dirs.values())
+            )
+            
+            for student_id, source_files in zip(submission_dirs, loaded_files):
                 if not source_files:
                     print(f"      ⚠️  No source files found for {student_id}")
                     continue
                 
-                # Filter and prepare rubric items for backend
-                filtered_rubric_items = filter_rubric_items_for_backend(rubric_items)
-                backend_rubric_items = []
-                for rubric_item in filtered_rubric_items:
-                    item_dict = {
-                        "id": rubric_item.id,
-                        "description": rubric_item.description,
-                        "points": rubric_item.points,
-                        "type": rubric_item.type
-                    }
-                    if rubric_item.options:
-                        if rubric_item.type == "RADIO":
-                            item_dict["options"] = add_credit_indicators_to_radio_options(rubric_item.options)
-                        else:
-                            item_dict["options"] = rubric_item.options
-                    backend_rubric_items.append(item_dict)
-                
                 # Create assignment context
                 assignment_context = {
                     "course_id": project_dir.name,
@@ -2596,45 +3000,21 @@ async def collect_evaluation_tasks(
     return tasks
 
 
-async def process_evaluation_batch(
+async def process_evaluation_tasks(
     tasks: List[EvaluationTask],
     backend_client: BackendClient,
-    batch_num: int,
-    total_batches: int
+    concurrency: int = DEFAULT_CONCURRENT_BATCH_SIZE
 ) -> List[Tuple[EvaluationTask, Any]]:
-    """Process a batch of evaluation tasks concurrently."""
-    batch_size = len(tasks)
-    print(f"📦 Student Batch {batch_num}/{total_batches}: processing {batch_size} students...")
-    
-    async def evaluate_single_task(task: EvaluationTask) -> Tuple[EvaluationTask, Any]:
-        """Evaluate a single task."""
-        try:
+    """Grade all evaluation tasks in one pool, starting the next student as soon as any request finishes."""
+    if DEBUG_RADIO:
+        for task in tasks:
             # Print radio button JSON for debugging
             print_radio_button_json(task.rubric_items, f"Concurrent - Student {task.student_id}: ")
-            
-            results = await backend_client.grade_submission(
-                assignment_context=task.assignment_context,
-                source_files=task.source_files,
-                rubric_items=task.rubric_items
-            )
-            print(f"✅ Student {task.student_id} ({task.project_name}/{task.csv_name}) completed")
-            return (task, results)
-        except Exception as e:
-            print(f"❌ Student {task.student_id} ({task.project_name}/{task.csv_name}) failed: {type(e).__name__}: {e}")
-            return (task, None)
-    
-    # Process all tasks in the batch concurrently
-    batch_start_time = asyncio.get_event_loop().time()
-    results = await asyncio.gather(*[evaluate_single_task(task) for task in tasks])
-    batch_duration = asyncio.get_event_loop().time() - batch_start_time
     
-    successful_results = [r for r in results if r[1] is not None]
-    failed_count = batch_size - len(successful_results)
-    
-    if failed_count > 0:
-        print(f"⚠️  Student Batch {batch_num} completed in {batch_duration:.1f}s: {len(successful_results)}/{batch_size} successful, {failed_count} failed")
-    else:
-        print(f"✅ Student Batch {batch_num} completed in {batch_duration:.1f}s: All {batch_size} students successful")
+    results = list(zip(tasks, await backend_client.grade_batch(tasks, concurrency=concurrency)))
+    for task, task_results in results:
+        if task_results is not None:
+            print(f"✅ Student {task.student_id} ({task.project_name}/{task.csv_name}) completed")
     
     return results
 
@@ -2645,33 +3025,26 @@ async def evaluate_projects_concurrent(
     num_students: int,
     output_dir: Path,
     concurrent_batch_size: int = DEFAULT_CONCURRENT_BATCH_SIZE,
-    points_analysis: bool = False
+    points_analysis: bool = False,
+    report_format: str = "xlsx",
+    use_cache: bool = True,
+    report_workers: int = DEFAULT_REPORT_WORKERS
 ) -> None:
     """Evaluate multiple projects using concurrent batch processing."""
     
     # Step 1: Collect all evaluation tasks
-    all_tasks = await collect_evaluation_tasks(projects_dir, num_students)
+    rubric_cache_dir = output_dir / RUBRIC_CACHE_DIRNAME if use_cache else None
+    all_tasks = await collect_evaluation_tasks(projects_dir, num_students, rubric_cache_dir)
     
     if not all_tasks:
         print("❌ No evaluation tasks found")
         return
     
-    # Step 2: Process tasks in concurrent batches
-    total_batches = (len(all_tasks) + concurrent_batch_size - 1) // concurrent_batch_size
-    print(f"🎯 Starting concurrent evaluation: {len(all_tasks)} students in {total_batches} batches (size: {concurrent_batch_size})")
+    # Step 2: Grade every task, keeping up to concurrent_batch_size requests in flight
+    print(f"🎯 Starting concurrent evaluation: {len(all_tasks)} students, up to {concurrent_batch_size} at a time")
     
-    all_results = []
     overall_start_time = asyncio.get_event_loop().time()
-    
-    for batch_num in range(total_batches):
-        start_idx = batch_num * concurrent_batch_size
-        end_idx = min(start_idx + concurrent_batch_size, len(all_tasks))
-        batch_tasks = all_tasks[start_idx:end_idx]
-        
-        batch_results = await process_evaluation_batch(
-            batch_tasks, backend_client, batch_num + 1, total_batches
-        )
-        all_results.extend(batch_results)
+    all_results = await process_evaluation_tasks(all_tasks, backend_client, concurrent_batch_size)
     
     overall_duration = asyncio.get_event_loop().time() - overall_start_time
     successful_count = len([r for r in all_results if r[1] is not None])
@@ -2684,13 +3057,15 @@ async def evaluate_projects_concurrent(
     print(f"   Throughput: {len(all_tasks)/overall_duration:.1f} students/second")
     
     # Step 3: Group results by project and generate reports
-    await generate_reports_from_results(all_results, output_dir, points_analysis)
+    await generate_reports_from_results(all_results, output_dir, points_analysis, report_format, report_workers)
 
 
 async def generate_reports_from_results(
     all_results: List[Tuple[EvaluationTask, Any]],
     output_dir: Path,
-    points_analysis: bool = False
+    points_analysis: bool = False,
+    report_format: str = "xlsx",
+    report_workers: int = DEFAULT_REPORT_WORKERS
 ) -> None:
     """Generate reports from the batched evaluation results."""
     
@@ -2739,22 +3114,11 @@ async def generate_reports_from_results(
             
             if points_analysis:
                 # Convert backend results to AIGradingResult format for points analysis
-                ai_results = {}
-                for student_id, results in csv_data['backend_results'].items():
-                    ai_decisions = {}
-                    for result in results:
-                        decision = type('obj', (object,), {
-                            'verdict': type('obj', (object,), {
-                                'decision': type('obj', (object,), {'value': 'CHECK' if result.decision else 'CROSS'})() if result.rubric_id.startswith('checkbox') else None,
-                                'selected_option': result.decision if result.rubric_id.startswith('radio') else None
-                            })()
-                        })()
-                        ai_decisions[result.rubric_id] = decision
-                    
-                    ai_results[student_id] = AIGradingResult(
-                        submission_id=student_id,
-                        decisions=ai_decisions
-                    )
+                rubric_types = rubric_types_by_id(csv_data['rubric_items'])
+                ai_results = {
+                    student_id: ai_grading_result(student_id, results, rubric_types)
+                    for student_id, results in csv_data['backend_results'].items()
+                }
                 
                 # Calculate points comparison
                 if ai_results:
@@ -2764,20 +3128,14 @@ async def generate_reports_from_results(
                     all_comparisons.extend(comparisons)
                     
                     # Calculate stats
-                    stats = PointsCalculator.calculate_rubric_stats(
-                        csv_data['human_grades'], ai_results, csv_data['rubric_items']
-                    )
+                    stats = PointsCalculator.calculate_rubric_stats(comparisons, csv_data['rubric_items'])
                     all_stats.extend(stats)
         
-        # Generate unified report
+        # Generate unified report, leaving out CSVs without rubric items or students
+        all_evaluation_data = drop_empty_evaluations(all_evaluation_data)
         if all_evaluation_data:
-            unified_report_generator = UnifiedExcelReportGenerator()
-            unified_output_path = output_dir / f"{project_name}_UNIFIED_evaluation.xlsx"
-            
-            unified_report_generator.create_unified_report(
-                project_name=project_name,
-                all_evaluation_data=all_evaluation_data,
-                output_path=unified_output_path
+            unified_output_path = write_unified_report(
+                project_name, all_evaluation_data, output_dir, report_format
             )
             
             print(f"    ✅ Unified report created: {unified_output_path}")
@@ -2793,7 +3151,7 @@ async def generate_reports_from_results(
     if projects_data:
         print(f"\n📊 Generating Cross-Project Unified Report...")
         try:
-            cross_project_generator = CrossProjectUnifiedReportGenerator()
+            cross_project_generator = CrossProjectUnifiedReportGenerator(max_workers=report_workers)
             cross_project_output_path = output_dir / "CROSS_PROJECT_UNIFIED_evaluation.xlsx"
             
             # Transform projects_data structure to match what CrossProjectUnifiedReportGenerator expects
@@ -2845,14 +3203,31 @@ async def main():
     parser.add_argument("--points-analysis", action="store_true",
                         help="Enable comprehensive points comparison analysis")
     parser.add_argument("--concurrent-batch-size", type=int, default=DEFAULT_CONCURRENT_BATCH_SIZE,
-                        help="Number of students to process concurrently (default: 20)")
+                        help=f"Maximum number of grading requests in flight at once (default: {DEFAULT_CONCURRENT_BATCH_SIZE})")
     parser.add_argument("--use-concurrent", action="store_true", default=True,
                         help="Use concurrent batch processing for improved performance")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="xlsx", dest="report_format",
+                        help="Unified report format: styled xlsx workbook or plain, much faster csv files")
+    parser.add_argument("--project-concurrency", type=int, default=DEFAULT_PROJECT_CONCURRENCY,
+                        help=f"Number of projects evaluated at once in sequential mode (default: {DEFAULT_PROJECT_CONCURRENCY})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse grades CSVs instead of reusing the cache in the output directory")
+    parser.add_argument("--reuse-results", action="store_true",
+                        help="Reuse backend results cached in the output directory for unchanged submissions (sequential mode)")
     parser.add_argument("--sequential", action="store_true",
-                        help="Use sequential processing (disables concurrent processing)")
+                        help="Evaluate project by project instead of batching students across all projects")
+    parser.add_argument("--gzip-requests", action="store_true",
+                        help="Gzip large grading request bodies (the backend must accept Content-Encoding: gzip)")
+    parser.add_argument("--report-workers", type=int, default=DEFAULT_REPORT_WORKERS,
+                        help="Processes used to compute cross-project report statistics (default: 1, in-process)")
+    parser.add_argument("--debug", action="store_true",
+                        help="Log every request payload and SSE event as pretty-printed JSON")
     
     args = parser.parse_args()
     
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
     # Setup
     projects_dir = Path(args.projects_dir)
     output_dir = Path(args.output_dir)
@@ -2862,64 +3237,80 @@ async def main():
         print(f"Projects directory not found: {projects_dir}")
         return
     
-    # Create backend client
-    backend_client = BackendClient(args.backend_url)
-    
-    # Test backend connection
-    try:
-        health_status = await backend_client.check_health()
-        print(f"✅ Backend connection successful: {health_status}")
-    except Exception as e:
-        print(f"❌ Backend connection failed: {e}")
-        print("Make sure the backend server is running!")
-        return
-    
-    # Find all project directories
-    project_dirs = [d for d in projects_dir.iterdir() if d.is_dir()]
-    if not project_dirs:
-        print(f"No project directories found in {projects_dir}")
-        return
+    # Create backend client; its pooled session is shared by every request
+    async with BackendClient(args.backend_url, compress_requests=args.gzip_requests) as backend_client:
+        # Test backend connection
+        try:
+            health_status = await backend_client.check_health()
+            print(f"✅ Backend connection successful: {health_status}")
+        except Exception as e:
+            print(f"❌ Backend connection failed: {e}")
+            print("Make sure the backend server is running!")
+            return
     
-    # Determine processing mode
-    use_concurrent = args.use_concurrent and not args.sequential
+        # Find all project directories
+        project_dirs = [d for d in projects_dir.iterdir() if d.is_dir()]
+        if not project_dirs:
+            print(f"No project directories found in {projects_dir}")
+            return
     
-    print(f"Found {len(project_dirs)} project(s) to evaluate")
-    print(f"Backend URL: {args.backend_url}")
-    print(f"Students per CSV: {args.num_students}")
-    print(f"Output directory: {output_dir}")
-    print(f"Points analysis: {'Enabled' if args.points_analysis else 'Disabled'}")
-    print(f"Processing mode: {'Concurrent' if use_concurrent else 'Sequential'}")
-    if use_concurrent:
-        print(f"Concurrent batch size: {args.concurrent_batch_size}")
+        # Determine processing mode
+        use_concurrent = args.use_concurrent and not args.sequential
     
-    # Process projects using chosen method
-    try:
+        print(f"Found {len(project_dirs)} project(s) to evaluate")
+        print(f"Backend URL: {args.backend_url}")
+        print(f"Students per CSV: {args.num_students}")
+        print(f"Output directory: {output_dir}")
+        print(f"Points analysis: {'Enabled' if args.points_analysis else 'Disabled'}")
+        print(f"Processing mode: {'Concurrent' if use_concurrent else 'Sequential'}")
+        print(f"Report format: {args.report_format}")
         if use_concurrent:
-            # Use new concurrent batch processing
-            await evaluate_projects_concurrent(
-                projects_dir, backend_client, args.num_students, output_dir,
-                args.concurrent_batch_size, args.points_analysis
-            )
+            print(f"Concurrent batch size: {args.concurrent_batch_size}")
         else:
-            # Use original sequential processing
-            for project_dir in project_dirs:
-                try:
-                    if args.points_analysis:
-                        await evaluate_project_with_points_analysis(
-                            project_dir, backend_client, args.num_students, output_dir
-                        )
-                    else:
-                        await evaluate_project(
-                            project_dir, backend_client, args.num_students, output_dir
-                        )
-                except Exception as e:
-                    print(f"❌ Error processing {project_dir.name}: {e}")
-                    continue
-    except Exception as e:
-        print(f"❌ Error during evaluation: {e}")
-        return
+            print(f"Project concurrency: {args.project_concurrency}")
+    
+        # Process projects using chosen method
+        try:
+            if use_concurrent:
+                # Use new concurrent batch processing
+                await evaluate_projects_concurrent(
+                    projects_dir, backend_client, args.num_students, output_dir,
+                    args.concurrent_batch_size, args.points_analysis, args.report_format,
+                    use_cache=not args.no_cache, report_workers=args.report_workers
+                )
+            else:
+                # Evaluate whole projects, overlapping up to --project-concurrency of them;
+                # their requests share one --concurrent-batch-size limit
+                project_semaphore = asyncio.Semaphore(args.project_concurrency)
+                request_semaphore = asyncio.Semaphore(args.concurrent_batch_size)
+            
+                async def run_project(project_dir: Path) -> None:
+                    async with project_semaphore:
+                        try:
+                            if args.points_analysis:
+                                await evaluate_project_with_points_analysis(
+                                    project_dir, backend_client, args.num_students, output_dir,
+                                    use_cache=not args.no_cache,
+                                    concurrency=args.concurrent_batch_size,
+                                    request_semaphore=request_semaphore
+                                )
+                            else:
+                                await evaluate_project(
+                                    project_dir, backend_client, args.num_students, output_dir,
+                                    args.concurrent_batch_size, args.report_format,
+                                    use_cache=not args.no_cache,
+                                    reuse_results=args.reuse_results,
+                                    request_semaphore=request_semaphore
+                                )
+                        except Exception as e:
+                            print(f"❌ Error processing {project_dir.name}: {e}")
+            
+                await asyncio.gather(*(run_project(project_dir) for project_dir in project_dirs))
+        except Exception as e:
+            print(f"❌ Error during evaluation: {e}")
+            return
     
-    print(f"\n🎉 Evaluation complete! Results saved to: {output_dir}")
+        print(f"\n🎉 Evaluation complete! Results saved to: {output_dir}")
 
 
 if __name__ == "__main__":
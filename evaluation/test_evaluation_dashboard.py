@@ -0,0 +1,280 @@
+"""Regression checks for the evaluation dashboard's CSV parsing and report statistics."""
+
+import csv
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from evaluation_dashboard import (
+    CSVParser,
+    EvaluationResult,
+    RubricItem,
+    StudentGrade,
+    UnifiedExcelReportGenerator,
+    compute_rubric_summary_stats,
+    index_backend_results,
+    load_cached_results,
+    parse_rubric_cached,
+    store_cached_results,
+    write_unified_report,
+)
+
+
+HEADERS = [
+    "Assignment Submission ID", "First Name", "Name", "SID", "Email", "Sections", "Total Score", "Status",
+    "Compiles cleanly", "[RADIO 1] Style: Excellent", "[RADIO 1] Style: Poor", "Comments", "Memory safe",
+]
+POINT_VALUES = ["Point Values", "", "", "", "", "", "", "", "2", "3", "0", "", "1"]
+
+
+def write_grades_csv(path: Path, student_rows) -> Path:
+    """Write a Gradescope-style grades CSV: header, student rows, a spacer row and the point values."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows([HEADERS, *student_rows, [""] * len(HEADERS), POINT_VALUES])
+    return path
+
+
+def test_parse_rubric_items(tmp_path):
+    rubric_items, _ = CSVParser.parse_rubric_from_csv(write_grades_csv(tmp_path / "grades.csv", [
+        ["1001", "A", "Ada", "1", "a@x", "s", "5", "Graded", "TRUE", "TRUE", "FALSE", "", "FALSE"],
+        ["1002", "B", "Bob", "2", "b@x", "s", "5", "Graded", "FALSE", "FALSE", "TRUE", "", "TRUE"],
+    ]))
+
+    assert [(item.id, item.type, item.points, item.column_index) for item in rubric_items] == [
+        ("checkbox_8", "CHECKBOX", 2.0, 8),
+        ("checkbox_12", "CHECKBOX", 1.0, 12),
+        ("radio_1", "RADIO", 3.0, 9),
+    ]
+    assert rubric_items[2].options == {
+        "Q": {"text": "Excellent", "points": "3.0"},
+        "W": {"text": "Poor", "points": "0.0"},
+    }
+
+
+def test_parse_skips_truncated_rows(tmp_path):
+    _, student_grades = CSVParser.parse_rubric_from_csv(write_grades_csv(tmp_path / "grades.csv", [
+        ["1001", "A", "Ada", "1", "a@x", "s", "5", "Graded", "TRUE", "TRUE", "FALSE", "", "TRUE"],
+        ["1002", "B", "Bob", "2", "b@x", "s"],  # Cut off inside the metadata columns
+        ["1003", "C", "Cy", "3", "c@x", "s", "5", "Graded", "TRUE", "FALSE", "TRUE"],  # Stops before "Memory safe"
+        ["", "D", "Dee", "4", "d@x", "s", "5", "Graded", "TRUE", "TRUE", "FALSE", "", "TRUE"],
+    ]))
+
+    assert list(student_grades) == ["1001", "1003"]
+    assert student_grades["1001"].name == "Ada"
+    assert student_grades["1001"].grades == {"checkbox_8": True, "checkbox_12": True, "radio_1": "Q"}
+    # Columns past the end of a row are left ungraded rather than recorded as unchecked
+    assert student_grades["1003"].grades == {"checkbox_8": True, "radio_1": "W"}
+
+
+def test_parse_true_ignores_case_and_padding(tmp_path):
+    _, student_grades = CSVParser.parse_rubric_from_csv(write_grades_csv(tmp_path / "grades.csv", [
+        ["1001", "A", "Ada", "1", "a@x", "s", "5", "Graded", "tRuE", "false", " True ", "", " true"],
+        ["1002", "B", "Bob", "2", "b@x", "s", "5", "Graded", "yes", "FALSE", "FALSE", "", "1"],
+    ]))
+
+    assert student_grades["1001"].grades == {"checkbox_8": True, "checkbox_12": True, "radio_1": "W"}
+    assert student_grades["1002"].grades == {"checkbox_8": False, "checkbox_12": False}
+
+
+def test_parse_rubric_cached_reparses_changed_csv(tmp_path, monkeypatch):
+    csv_path = write_grades_csv(tmp_path / "grades.csv", [
+        ["1001", "A", "Ada", "1", "a@x", "s", "5", "Graded", "TRUE", "TRUE", "FALSE", "", "FALSE"],
+    ])
+    cache_dir = tmp_path / ".rubric_cache"
+    rubric_items, student_grades = parse_rubric_cached(csv_path, cache_dir)
+    assert list(student_grades) == ["1001"]
+
+    # An unchanged file is served from the cache without parsing it again
+    def fail(_csv_path):
+        raise AssertionError("cached CSV was parsed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(CSVParser, "parse_rubric_from_csv", staticmethod(fail))
+        assert parse_rubric_cached(csv_path, cache_dir) == (rubric_items, student_grades)
+
+    # A same-size rewrite is only told apart by its modification time, and is parsed again
+    size = os.stat(csv_path).st_size
+    write_grades_csv(csv_path, [
+        ["1002", "B", "Bob", "2", "b@x", "s", "5", "Graded", "TRUE", "TRUE", "FALSE", "", "FALSE"],
+    ])
+    assert os.stat(csv_path).st_size == size
+    mtime_ns = os.stat(csv_path).st_mtime_ns + 1_000_000_000
+    os.utime(csv_path, ns=(mtime_ns, mtime_ns))
+    _, student_grades = parse_rubric_cached(csv_path, cache_dir)
+    assert list(student_grades) == ["1002"]
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+
+def per_item_summary_stats(rubric_items, human_grades, backend_results):
+    """Reference per-rubric, per-student loop the vectorized summary statistics replaced."""
+    stats = []
+    for rubric_item in rubric_items:
+        total = matches = false_positives = false_negatives = no_data = confidence_count = 0
+        confidence_sum = 0.0
+        for submission_id, student_grade in human_grades.items():
+            total += 1
+            human_value = student_grade.grades.get(rubric_item.id, False)
+            backend_result = next(
+                (r for r in backend_results.get(submission_id, []) if r.rubric_id == rubric_item.id), None
+            )
+            if not backend_result:
+                no_data += 1
+                continue
+            confidence_sum += backend_result.confidence
+            confidence_count += 1
+            if rubric_item.type == "CHECKBOX":
+                backend_bool = backend_result.decision == "check"
+                if human_value == backend_bool:
+                    matches += 1
+                elif human_value and not backend_bool:
+                    false_negatives += 1
+                else:
+                    false_positives += 1
+            elif str(human_value) == backend_result.decision:
+                matches += 1
+            else:
+                false_positives += 1
+        stats.append({
+            'total': total,
+            'matches': matches,
+            'false_positives': false_positives,
+            'false_negatives': false_negatives,
+            'no_data': no_data,
+            'accuracy': matches / (total - no_data) if total - no_data > 0 else 0,
+            'avg_confidence': confidence_sum / confidence_count if confidence_count else 0,
+        })
+    return stats
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_summary_stats_match_per_item_loop(seed):
+    rnd = random.Random(seed)
+    rubric_items = [
+        RubricItem(id="checkbox_8", description="Compiles", points=2.0, type="CHECKBOX"),
+        RubricItem(id="checkbox_9", description="Memory safe", points=1.0, type="CHECKBOX"),
+        RubricItem(id="radio_1", description="Style", points=3.0, type="RADIO",
+                   options={"Q": {"text": "Good", "points": "3.0"}, "W": {"text": "Poor", "points": "0.0"}}),
+    ]
+    human_grades = {}
+    backend_results = {}
+    for student in range(12):
+        submission_id = f"s{student}"
+        grades = {"checkbox_8": rnd.random() < 0.5, "checkbox_9": rnd.random() < 0.5}
+        if rnd.random() < 0.8:  # Some students have no radio selection at all
+            grades["radio_1"] = rnd.choice("QW")
+        human_grades[submission_id] = StudentGrade(submission_id=submission_id, name=f"Student {student}", grades=grades)
+        if rnd.random() < 0.15:  # Some students have no backend results
+            continue
+        results = []
+        for rubric_item in rubric_items:
+            if rnd.random() < 0.15:
+                continue
+            if rubric_item.type == "CHECKBOX":
+                decision = rnd.choice(["check", "uncheck"])
+            else:
+                decision = rnd.choice(["Q", "W", ""])
+            results.append(EvaluationResult(submission_id=submission_id, rubric_id=rubric_item.id, decision=decision,
+                                            confidence=rnd.random(), comment="", evidence={}))
+        if results and rnd.random() < 0.3:  # A duplicate result never overrides the first one
+            first = results[0]
+            results.append(EvaluationResult(submission_id=submission_id, rubric_id=first.rubric_id, decision="?",
+                                            confidence=1.0, comment="dup", evidence={}))
+        backend_results[submission_id] = results
+
+    expected = per_item_summary_stats(rubric_items, human_grades, backend_results)
+    # The unified report hands over the results its row pass already looked up
+    human_rows = []
+    result_rows = []
+    for _ in UnifiedExcelReportGenerator._iter_student_rows(
+        rubric_items, human_grades, index_backend_results(backend_results), human_rows, result_rows
+    ):
+        pass
+
+    for stats in (
+        compute_rubric_summary_stats(rubric_items, human_grades, backend_results),
+        compute_rubric_summary_stats(rubric_items, human_grades, backend_results,
+                                     human_rows=human_rows, result_rows=result_rows),
+    ):
+        assert len(stats) == len(expected)
+        for stat, reference in zip(stats, expected):
+            for key in ('total', 'matches', 'false_positives', 'false_negatives', 'no_data'):
+                assert stat[key] == reference[key], key
+            assert stat['accuracy'] == pytest.approx(reference['accuracy'])
+            assert stat['avg_confidence'] == pytest.approx(reference['avg_confidence'])
+
+
+def test_result_cache_round_trip(tmp_path):
+    results = [
+        EvaluationResult(submission_id="1001", rubric_id="checkbox_8", decision="check", confidence=0.875,
+                         comment="Compiles without warnings", evidence={"file": "main.cpp", "lines": [1, 4]}),
+        EvaluationResult(submission_id="1001", rubric_id="radio_1", decision="W", confidence=0.5,
+                         comment="", evidence={}),
+    ]
+    cache_path = tmp_path / ".result_cache" / "1001_abc.json"
+
+    assert load_cached_results(cache_path) is None
+    store_cached_results(cache_path, results)
+    assert load_cached_results(cache_path) == results
+
+
+def test_result_cache_ignores_corrupt_entries(tmp_path):
+    cache_path = tmp_path / "1001_abc.json"
+    cache_path.write_text("{not json", encoding='utf-8')
+
+    assert load_cached_results(cache_path) is None
+
+
+def read_csv_rows(path: Path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def test_unified_csv_report(tmp_path):
+    rubric_items = [
+        RubricItem(id="checkbox_8", description="Compiles", points=2.0, type="CHECKBOX", column_index=8),
+        RubricItem(id="radio_1", description="Style", points=3.0, type="RADIO", column_index=9,
+                   options={"Q": {"text": "Good", "points": "3.0"}, "W": {"text": "Poor", "points": "0.0"}}),
+    ]
+    human_grades = {
+        "1001": StudentGrade(submission_id="1001", name="Ada", grades={"checkbox_8": True, "radio_1": "Q"}),
+        "1002": StudentGrade(submission_id="1002", name="Bob", grades={"checkbox_8": False, "radio_1": "W"}),
+    }
+    backend_results = {"1001": [
+        EvaluationResult(submission_id="1001", rubric_id="checkbox_8", decision="check", confidence=0.9,
+                         comment="ok", evidence={}),
+        EvaluationResult(submission_id="1001", rubric_id="radio_1", decision="W", confidence=0.5,
+                         comment="", evidence={}),
+    ]}
+    eval_data = {'csv_name': "hw1", 'rubric_items': rubric_items, 'human_grades': human_grades,
+                 'backend_results': backend_results}
+
+    summary_path = write_unified_report("proj", [eval_data], tmp_path, "csv")
+
+    assert summary_path == tmp_path / "proj_UNIFIED_evaluation.csv"
+    assert read_csv_rows(summary_path) == [
+        UnifiedExcelReportGenerator.SUMMARY_HEADERS,
+        ["hw1", "Compiles", "CHECKBOX", "2", "1", "0", "0", "1", "100.0", "90.0"],
+        ["hw1", "Style", "RADIO", "2", "0", "1", "0", "1", "0.0", "50.0"],
+    ]
+    # Students without a backend result keep the backend columns empty
+    assert read_csv_rows(tmp_path / "proj_UNIFIED_evaluation_hw1.csv") == [
+        ["Submission ID", "Student Name",
+         "Compiles", "Backend Decision", "Confidence %", "Comment", "Match?",
+         "Style", "Backend Decision", "Confidence %", "Comment", "Match?"],
+        ["1001", "Ada", "TRUE", "TRUE", "90.0", "ok", "MATCH", "Q", "W", "50.0", "", "MISMATCH"],
+        ["1002", "Bob", "FALSE", "", "", "", "NO DATA", "W", "", "", "", "NO DATA"],
+    ]
+    points_rows = read_csv_rows(tmp_path / "proj_UNIFIED_evaluation_POINTS_BY_SUBMISSION.csv")
+    assert points_rows == [
+        UnifiedExcelReportGenerator.SUBMISSION_POINTS_HEADERS,
+        ["hw1", "1001", "5.0", "2.0", "-3.0", "-60.0", "AI LOWER"],
+    ]
+    rubric_rows = read_csv_rows(tmp_path / "proj_UNIFIED_evaluation_RUBRIC_POINTS_ANALYSIS.csv")
+    assert rubric_rows[0] == UnifiedExcelReportGenerator.RUBRIC_POINTS_HEADERS
+    # Largest human/AI difference first
+    assert [row[:7] for row in rubric_rows[1:]] == [
+        ["hw1", "Style", "RADIO", "3.0", "3.00", "0.00", "-3.00"],
+        ["hw1", "Compiles", "CHECKBOX", "2.0", "2.00", "2.00", "0.00"],
+    ]